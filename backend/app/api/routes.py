@@ -6,12 +6,16 @@ This module defines all API endpoints with proper documentation,
 error handling, and request tracking.
 """
 
+import asyncio
 import io
+import itertools
+import logging
+import secrets
 import time
-import uuid
-from datetime import datetime
-from fastapi import APIRouter, UploadFile, File, HTTPException, Response
-from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, BinaryIO, Dict, Optional, Tuple
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 
 from ..api.schemas import (
     TranscribeRequest, TranscribeResponse,
@@ -20,16 +24,131 @@ from ..api.schemas import (
     HealthResponse
 )
 from ..providers.base import ProviderException
+from ..providers.registry import ProviderRegistry
+from ..nlu.intent_router import generate_response
 from ..telemetry.logging_config import get_logger, request_id_ctx, log_with_timing
 from ..utils.redaction import redact_transcript
+from ..utils.concurrency import ConcurrencyLimiter
 from ..core.config import settings
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Request IDs are a random per-process prefix plus a counter: unique within the
+# process lifetime and far cheaper than a uuid4 per request. next() on
+# itertools.count is atomic under the GIL, so no lock is needed.
+_REQUEST_ID_PREFIX = secrets.token_hex(3)
+_request_counter = itertools.count()
+
+
 def generate_request_id() -> str:
-    return f"req_{uuid.uuid4().hex[:12]}"
+    return f"req_{_REQUEST_ID_PREFIX}{next(_request_counter):09x}"
+
+
+_timestamp_cache = (0, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Returns the current UTC time in ISO format, formatted at most once per second.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _timestamp_cache[1]
+
+
+# Bounds in-flight STT jobs so concurrent uploads can't exhaust memory or threads
+_stt_limiter = ConcurrencyLimiter(
+    settings.stt_max_concurrent,
+    max_queue=settings.stt_max_queue if settings.stt_reject_on_saturation else None
+)
+
+# Last readiness result as (time.monotonic() of the check, response)
+_ready_cache: Optional[Tuple[float, HealthResponse]] = None
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Wraps a response model in the app's ORJSONResponse.
+    
+    Returning a Response skips FastAPI's second validation pass and
+    jsonable_encoder for data we just built ourselves, while the body is
+    still encoded by orjson like every other JSON response; response_model
+    on the route is still used for the OpenAPI docs.
+    """
+    return ORJSONResponse(model.model_dump())
+
+
+class RequestContext:
+    """
+    Per-request bookkeeping shared by the handlers.
+    
+    Entering generates the request ID, binds it to the logging context and
+    starts the timer; leaving logs "<name> completed" with the duration and
+    any fields added to ``extras``. Nothing is logged if the block raises,
+    the handlers log their own errors.
+    
+    Example:
+        async with RequestContext("Transcription", file_name=name) as ctx:
+            ctx.extras["confidence"] = result.confidence
+            return TranscribeResponse(request_id=ctx.request_id, duration_ms=ctx.duration_ms, ...)
+    """
+    
+    __slots__ = ("name", "request_id", "extras", "_start_fields", "_start_ns", "_duration_ms")
+    
+    def __init__(self, name: str, **start_fields):
+        """
+        Args:
+            name: Operation name used in the started/completed log messages
+            **start_fields: Extra fields for the started log message
+        """
+        self.name = name
+        self.request_id = ""
+        self.extras: Dict[str, Any] = {}
+        self._start_fields = start_fields
+        self._start_ns = 0
+        self._duration_ms: Optional[int] = None
+    
+    @property
+    def duration_ms(self) -> int:
+        """
+        Elapsed time in ms, frozen on first access so responses and logs agree.
+        """
+        if self._duration_ms is None:
+            self._duration_ms = (time.perf_counter_ns() - self._start_ns) // 1_000_000
+        return self._duration_ms
+    
+    async def __aenter__(self) -> "RequestContext":
+        self.request_id = generate_request_id()
+        request_id_ctx.set(self.request_id)
+        self._start_ns = time.perf_counter_ns()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{self.name} started", extra={"extra_fields": self._start_fields})
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            log_with_timing(logger, f"{self.name} completed", duration_ms=self.duration_ms, **self.extras)
+
+
+def upload_size(file: BinaryIO) -> int:
+    """
+    Returns the size of a spooled upload without reading it.
+    """
+    file.seek(0, io.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+    return size
+
+
+def get_providers(request: Request) -> ProviderRegistry:
+    """
+    Dependency returning the shared provider registry of the application.
+    """
+    return request.app.state.providers
 
 
 @router.post(
@@ -41,8 +160,9 @@ def generate_request_id() -> str:
 async def transcribe_audio(
     file: UploadFile = File(..., description="Audio file (WAV, MP3, etc.)"),
     language: str = None,
-    privacy_mode: bool = True
-) -> TranscribeResponse:
+    privacy_mode: bool = True,
+    providers: ProviderRegistry = Depends(get_providers)
+) -> Response:
     """
     Transcribe uploaded audio file to text. This endpoint should be the main point of
     the application at the moment until Whisper is implemented.
@@ -56,53 +176,52 @@ async def transcribe_audio(
         TranscribeResponse with transcribed text and metadata
         
     Raises:
-        HTTPException: If transcription fails
+        HTTPException: If the upload is too large (413), the server is
+            saturated (429), or transcription fails
     """
-    request_id = generate_request_id()
-    request_id_ctx.set(request_id)
-    
-    start_time = time.time()
-    logger.info(f"Transcription request started", extra={"extra_fields": {"file_name": file.filename}})
-    
-    try:
-        from ..providers.stt_whisper import FasterWhisperProvider
+    async with RequestContext("Transcription", file_name=file.filename) as ctx:
+        # A declared Content-Length is checked by the limit_upload_size
+        # middleware before the body is read; chunked uploads carry none, so
+        # check the spooled size here. Starlette keeps anything above 1 MB on disk
+        if upload_size(file.file) > settings.max_upload_bytes:
+            logger.warning("Upload rejected: spooled file exceeds limit")
+            raise HTTPException(status_code=413, detail="Audio file too large")
         
-        stt_provider = FasterWhisperProvider(
-            model_size=settings.whisper_model_size
-        )
+        if _stt_limiter.saturated:
+            logger.warning("Transcription rejected: server saturated")
+            raise HTTPException(status_code=429, detail="Server saturated, please retry later")
         
-        audio_bytes = await file.read()
-        audio_io = io.BytesIO(audio_bytes)
-        result = await stt_provider.transcribe(audio_io, language=language)
+        try:
+            stt_batcher = providers.stt_batcher
+            
+            # The upload is already spooled (in memory up to 1 MB, on disk above),
+            # so hand the file object over as-is instead of copying it into RAM
+            await file.seek(0)
+            async with _stt_limiter:
+                result = await stt_batcher.submit(file.file, language=language)
+            
+            text_redacted = None
+            if privacy_mode:
+                # Redaction is CPU-bound, keep it off the event loop for long transcripts
+                text_redacted = await asyncio.to_thread(redact_transcript, result.text, True)
+            
+            ctx.extras["confidence"] = result.confidence
+            
+            return json_response(TranscribeResponse(
+                request_id=ctx.request_id,
+                text=result.text,
+                text_redacted=text_redacted,
+                confidence=result.confidence,
+                language=result.language,
+                duration_ms=ctx.duration_ms
+            ))
         
-        text_redacted = None
-        if privacy_mode:
-            text_redacted = redact_transcript(result.text, aggressive=True)
-
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        log_with_timing(
-            logger,
-            "Transcription completed",
-            duration_ms=duration_ms,
-            confidence=result.confidence
-        )
-        
-        return TranscribeResponse(
-            request_id=request_id,
-            text=result.text,
-            text_redacted=text_redacted,
-            confidence=result.confidence,
-            language=result.language,
-            duration_ms=duration_ms
-        )
-    
-    except ProviderException as e:
-        logger.error(f"Provider error: {e}")
-        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+        except ProviderException as e:
+            logger.error(f"Provider error: {e}")
+            raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post(
@@ -111,7 +230,10 @@ async def transcribe_audio(
     summary="Classify intent from text",
     description="Classify user intent and extract entities from transcribed text."
 )
-async def route_intent(request: IntentRequest) -> IntentResponse:
+async def route_intent(
+    request: IntentRequest,
+    providers: ProviderRegistry = Depends(get_providers)
+) -> Response:
     """
     Classify intent from user input text endpoint.
     
@@ -124,47 +246,31 @@ async def route_intent(request: IntentRequest) -> IntentResponse:
     Raises:
         HTTPException: If classification fails
     """
-    request_id = generate_request_id()
-    request_id_ctx.set(request_id)
-    
-    start_time = time.time()
-    logger.info("Intent classification started")
-    
-    try:
-        from ..nlu.intent_router import RuleBasedIntentRouter, generate_response
-        
-        intent_router = RuleBasedIntentRouter(
-            confidence_threshold=settings.intent_confidence_threshold
-        )
+    async with RequestContext("Intent classification") as ctx:
+        try:
+            intent_router = providers.intent
+            
+            result = await intent_router.route(request.text)
+            
+            response_text = generate_response(result)
+            
+            ctx.extras["intent"] = result.intent
+            ctx.extras["confidence"] = result.confidence
+            
+            return json_response(IntentResponse(
+                request_id=ctx.request_id,
+                intent=result.intent,
+                confidence=result.confidence,
+                entities=result.entities,
+                handoff_recommended=result.handoff_recommended,
+                reasoning=result.reasoning,
+                response_text=response_text,
+                duration_ms=ctx.duration_ms
+            ))
         
-        result = await intent_router.route(request.text)
-        
-        response_text = generate_response(result)
-        
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        log_with_timing(
-            logger,
-            "Intent classification completed",
-            duration_ms=duration_ms,
-            intent=result.intent,
-            confidence=result.confidence
-        )
-        
-        return IntentResponse(
-            request_id=request_id,
-            intent=result.intent,
-            confidence=result.confidence,
-            entities=result.entities,
-            handoff_recommended=result.handoff_recommended,
-            reasoning=result.reasoning,
-            response_text=response_text,
-            duration_ms=duration_ms
-        )
-    
-    except Exception as e:
-        logger.error(f"Intent classification error: {e}")
-        raise HTTPException(status_code=500, detail="Intent classification failed")
+        except Exception as e:
+            logger.error(f"Intent classification error: {e}")
+            raise HTTPException(status_code=500, detail="Intent classification failed")
 
 
 @router.post(
@@ -178,12 +284,17 @@ async def route_intent(request: IntentRequest) -> IntentResponse:
         }
     }
 )
-async def speak_text(request: TTSRequest) -> Response:
+async def speak_text(
+    request: TTSRequest,
+    stream: bool = True,
+    providers: ProviderRegistry = Depends(get_providers)
+) -> Response:
     """
     Convert text to speech audio endpoint.
     
     Args:
         request: TTSRequest with text and voice options
+        stream: Stream audio as it is synthesized (false returns the full WAV at once)
         
     Returns:
         Audio file as streaming response
@@ -191,51 +302,60 @@ async def speak_text(request: TTSRequest) -> Response:
     Raises:
         HTTPException: If synthesis fails
     """
-    request_id = generate_request_id()
-    request_id_ctx.set(request_id)
-    
-    start_time = time.time()
-    logger.info("TTS synthesis started", extra={"extra_fields": {"text_length": len(request.text)}})
-    
-    try:
-        from ..providers.tts_piper import PiperTTSProvider
-        
-        tts_provider = PiperTTSProvider(
-            model_path=settings.piper_model_path,
-            voice=settings.piper_voice
-        )
-        
-        audio_bytes = await tts_provider.synthesize(
-            text=request.text,
-            voice=request.voice,
-            speed=request.speed
-        )
-        
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        log_with_timing(
-            logger,
-            "TTS synthesis completed",
-            duration_ms=duration_ms,
-            audio_size=len(audio_bytes)
-        )
+    name = "TTS stream" if stream else "TTS synthesis"
+    async with RequestContext(name, text_length=len(request.text)) as ctx:
+        try:
+            tts_provider = providers.tts
+            
+            if stream:
+                chunks = tts_provider.synthesize_stream(
+                    text=request.text,
+                    voice=request.voice,
+                    speed=request.speed
+                )
+                
+                # Wait for the first chunk here so failures still map to an HTTP error;
+                # the logged duration is the time to first byte
+                first_chunk = await chunks.__anext__()
+                body = _prepend_chunk(first_chunk, chunks)
+                response_class = StreamingResponse
+            else:
+                audio_bytes = await tts_provider.synthesize(
+                    text=request.text,
+                    voice=request.voice,
+                    speed=request.speed
+                )
+                ctx.extras["audio_size"] = len(audio_bytes)
+                body = audio_bytes
+                response_class = Response
+            
+            return response_class(
+                body,
+                media_type="audio/wav",
+                headers={
+                    "X-Request-ID": ctx.request_id,
+                    "X-Duration-MS": str(ctx.duration_ms),
+                    "Content-Disposition": "inline; filename=speech.wav",
+                    # WAV doesn't compress well, keep gzip from spending CPU on it
+                    "Content-Encoding": "identity"
+                }
+            )
         
-        return Response(
-            content=audio_bytes,
-            media_type="audio/wav",
-            headers={
-                "X-Request-ID": request_id,
-                "X-Duration-MS": str(duration_ms),
-                "Content-Disposition": "inline; filename=speech.wav"
-            }
-        )
-    
-    except ProviderException as e:
-        logger.error(f"Provider error: {e}")
-        raise HTTPException(status_code=500, detail=f"TTS synthesis failed: {str(e)}")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+        except ProviderException as e:
+            logger.error(f"Provider error: {e}")
+            raise HTTPException(status_code=500, detail=f"TTS synthesis failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+
+async def _prepend_chunk(first_chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Yields an already received chunk followed by the rest of the stream.
+    """
+    yield first_chunk
+    async for chunk in chunks:
+        yield chunk
 
 
 @router.get(
@@ -244,17 +364,17 @@ async def speak_text(request: TTSRequest) -> Response:
     summary="Basic health check",
     description="Returns basic liveness status (does not check providers)."
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Basic health check endpoint to check whether the service is active.
     
     Returns:
         HealthResponse indicating service is alive
     """
-    return HealthResponse(
+    return json_response(HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat() + "Z"
-    )
+        timestamp=utc_timestamp()
+    ))
 
 
 @router.get(
@@ -263,7 +383,9 @@ async def health_check() -> HealthResponse:
     summary="Readiness check",
     description="Checks if all providers are operational and ready to serve requests."
 )
-async def readiness_check() -> HealthResponse:
+async def readiness_check(
+    providers: ProviderRegistry = Depends(get_providers)
+) -> Response:
     """
     Readiness check endpoint - verifies if all providers are operational.
     
@@ -273,19 +395,19 @@ async def readiness_check() -> HealthResponse:
     Raises:
         HTTPException: If any critical provider is unhealthy
     """
+    global _ready_cache
+    
+    now = time.monotonic()
+    if _ready_cache is not None and now - _ready_cache[0] < settings.readiness_cache_ttl_ms / 1000:
+        return json_response(_ready_cache[1])
+    
     try:
-        from ..providers.stt_whisper import FasterWhisperProvider
-        from ..providers.tts_piper import PiperTTSProvider
-        from ..nlu.intent_router import RuleBasedIntentRouter
-        
-        # Check each provider
-        stt_provider = FasterWhisperProvider(model_size=settings.whisper_model_size)
-        tts_provider = PiperTTSProvider(model_path=settings.piper_model_path)
-        intent_router = RuleBasedIntentRouter()
-        
-        stt_healthy = await stt_provider.health_check()
-        tts_healthy = await tts_provider.health_check()
-        intent_healthy = await intent_router.health_check()
+        # Check each shared provider concurrently, a hung one counts as unhealthy
+        stt_healthy, tts_healthy, intent_healthy = await asyncio.gather(
+            _probe_provider(providers.stt),
+            _probe_provider(providers.tts),
+            _probe_provider(providers.intent)
+        )
         
         providers_status = {
             "stt": stt_healthy,
@@ -297,18 +419,35 @@ async def readiness_check() -> HealthResponse:
         
         if not all_healthy:
             logger.warning(f"Some providers unhealthy: {providers_status}")
-            return HealthResponse(
+            response = HealthResponse(
                 status="degraded",
-                timestamp=datetime.utcnow().isoformat() + "Z",
+                timestamp=utc_timestamp(),
+                providers=providers_status
+            )
+        else:
+            response = HealthResponse(
+                status="ready",
+                timestamp=utc_timestamp(),
                 providers=providers_status
             )
         
-        return HealthResponse(
-            status="ready",
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            providers=providers_status
-        )
+        _ready_cache = (now, response)
+        return json_response(response)
     
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
         raise HTTPException(status_code=503, detail="Service not ready")
+
+
+async def _probe_provider(provider) -> bool:
+    """
+    Runs a provider health check, treating a timeout as unhealthy.
+    """
+    try:
+        return await asyncio.wait_for(
+            provider.health_check(),
+            timeout=settings.health_check_timeout_ms / 1000
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Health check timed out for {type(provider).__name__}")
+        return False
@@ -5,7 +5,7 @@ This module defines all data models for the API, ensuring type safety
 and automatic validation/documentation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from enum import Enum
 
@@ -39,8 +39,8 @@ class TranscribeResponse(BaseModel):
     language: Optional[str] = Field(None, description="Detected language")
     duration_ms: int = Field(..., description="Transcription duration in milliseconds")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "request_id": "req_abc123",
                 "text": "I need an appointment next Tuesday at 2 PM",
@@ -50,6 +50,7 @@ class TranscribeResponse(BaseModel):
                 "duration_ms": 1234
             }
         }
+    )
 
 
 class IntentRequest(BaseModel):
@@ -58,12 +59,13 @@ class IntentRequest(BaseModel):
     """
     text: str = Field(..., description="Text to classify", min_length=1)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "I need an appointment next Tuesday at 2 PM"
             }
         }
+    )
 
 
 class IntentResponse(BaseModel):
@@ -79,8 +81,8 @@ class IntentResponse(BaseModel):
     response_text: str = Field(..., description="Generated natural language response")
     duration_ms: int = Field(..., description="Processing duration in milliseconds")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "request_id": "req_abc123",
                 "intent": "APPOINTMENT_SCHEDULING",
@@ -95,6 +97,7 @@ class IntentResponse(BaseModel):
                 "duration_ms": 42
             }
         }
+    )
 
 
 class TTSRequest(BaseModel):
@@ -105,14 +108,15 @@ class TTSRequest(BaseModel):
     voice: Optional[str] = Field(None, description="Voice identifier")
     speed: float = Field(1.0, ge=0.5, le=2.0, description="Speech rate (0.5-2.0)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "I can help you schedule an appointment. What day works best for you?",
                 "voice": "en_US-lessac-medium",
                 "speed": 1.0
             }
         }
+    )
 
 
 class TTSResponse(BaseModel):
@@ -124,8 +128,8 @@ class TTSResponse(BaseModel):
     text_length: int = Field(..., description="Length of synthesized text")
     audio_format: str = Field(..., description="Audio format (e.g., 'wav', 'mp3')")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "request_id": "req_abc123",
                 "duration_ms": 856,
@@ -133,6 +137,7 @@ class TTSResponse(BaseModel):
                 "audio_format": "wav"
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -143,8 +148,8 @@ class HealthResponse(BaseModel):
     timestamp: str = Field(..., description="Check timestamp (ISO format)")
     providers: Optional[Dict[str, bool]] = Field(None, description="Provider health status")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2024-02-14T10:30:00Z",
@@ -155,6 +160,7 @@ class HealthResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -166,8 +172,8 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Human-readable error message")
     detail: Optional[str] = Field(None, description="Additional error details")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "request_id": "req_abc123",
                 "error": "TranscriptionError",
@@ -175,6 +181,7 @@ class ErrorResponse(BaseModel):
                 "detail": "Audio format not supported"
             }
         }
+    )
 
 
 class PartialTranscriptMessage(BaseModel):
@@ -28,9 +28,21 @@ class Settings(BaseSettings):
     app_name: str = "FrontOffice Voice Console"
     debug: bool = False
     
+    # Logging: fraction of DEBUG/INFO records kept (WARNING and above are always kept)
+    log_sample_rate_debug: float = 1.0
+    log_sample_rate_info: float = 1.0
+    
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    # Each worker process loads its own models, and the concurrency limits and
+    # caches below apply per process; raise this only with memory to spare
+    workers: int = 1
+    # Idle keep-alive in seconds; longer than typical load balancer idle timeouts
+    # (e.g. 60s) so probes and clients reuse connections instead of reconnecting
+    keep_alive_timeout: int = 75
+    # GPU deployments run a single worker; its one model serves every request
+    gpu_mode: bool = False
     
     # Provider Selection
     # TODO: When another TTS model/service is included, please use the .env file settings.
@@ -39,9 +51,30 @@ class Settings(BaseSettings):
 
     whisper_model_size: str = "base"  # tiny, base, small, medium, large
     whisper_model_path: str = "/app/models/whisper"
+    whisper_compute_type: str = "auto"  # auto = int8 on CPU, int8_float16 on CUDA
+    whisper_num_workers: int = 1  # Parallel transcriptions sharing one model
+    whisper_cpu_threads: int = 0  # CTranslate2 threads per worker (0 = split the cores across all workers)
+    whisper_beam_size: int = 1  # 1 = greedy decoding, lowest latency
+    
+    # Run a dummy request through each provider at startup (disable in tests)
+    warm_on_startup: bool = True
+    
+    # STT micro-batching (requests arriving within the window are grouped).
+    # Off by default, and only started for providers with supports_batching,
+    # since the window adds latency to every request for nothing otherwise
+    stt_batching_enabled: bool = False
+    stt_batch_max_size: int = 8
+    stt_batch_max_wait_ms: int = 50
+    
+    # STT admission control: jobs running at once, and how many may wait for a
+    # slot before new requests are rejected with 429
+    stt_max_concurrent: int = 8
+    stt_max_queue: int = 16
+    stt_reject_on_saturation: bool = True
     
     piper_model_path: str = "/app/models/piper"
     piper_voice: str = "en_US-lessac-medium"
+    tts_cache_size: int = 256  # Synthesized replies kept in memory (0 disables)
     
     # Privacy & Security
     privacy_mode: bool = True
@@ -50,11 +83,19 @@ class Settings(BaseSettings):
     
     # Intent Recognition
     intent_confidence_threshold: float = 0.6
+    intent_cache_size: int = 256
     
     # Timeouts (in milliseconds)
     stt_timeout_ms: int = 30000
     tts_timeout_ms: int = 15000
     intent_timeout_ms: int = 5000
+    health_check_timeout_ms: int = 1000
+    
+    # Readiness results are reused for this long before providers are probed again
+    readiness_cache_ttl_ms: int = 2000
+    
+    # Uploads
+    max_upload_bytes: int = 100 * 1024 * 1024  # 100 MB
     
     # CORS
     # TODO: This must be changed to a .env file when whisper is implemented
@@ -7,14 +7,23 @@ STT, TTS, and intent recognition services for medical front office workflows.
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import logging
 import time
 
 from .core.config import settings
 from .api.routes import router as api_router
+from .providers.registry import ProviderRegistry
 from .telemetry.logging_config import setup_logging, get_logger
 
-setup_logging(debug=settings.debug)
+setup_logging(
+    debug=settings.debug,
+    sample_rates={
+        logging.DEBUG: settings.log_sample_rate_debug,
+        logging.INFO: settings.log_sample_rate_info,
+    }
+)
 logger = get_logger(__name__)
 
 app = FastAPI(
@@ -27,8 +36,12 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
+# Shared provider instances, reused by every request (see api.routes.get_providers)
+app.state.providers = ProviderRegistry(settings)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -37,15 +50,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies; responses that set Content-Encoding themselves
+# (the WAV audio from /tts/speak) are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=6)
+
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """
+    Rejects bodies whose declared Content-Length exceeds max_upload_bytes.
+    
+    Runs before the route reads (and spools) the body; chunked uploads have
+    no Content-Length and are size-checked by the route after spooling.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            size = int(content_length)
+        except ValueError:
+            return ORJSONResponse(status_code=400, content={"detail": "Invalid Content-Length header"})
+        if size > settings.max_upload_bytes:
+            logger.warning("Upload rejected: %d bytes exceeds limit", size)
+            return ORJSONResponse(status_code=413, content={"detail": "Request body too large"})
+    return await call_next(request)
+
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """
     Adds request processing time to response headers.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
@@ -56,7 +93,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     Handles unexpected exceptions gracefully.
     """
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
@@ -79,6 +116,11 @@ async def startup_event():
     logger.info(f"STT Provider: {settings.stt_provider}")
     logger.info(f"TTS Provider: {settings.tts_provider}")
     logger.info(f"Privacy Mode: {settings.privacy_mode}")
+    
+    app.state.providers.load()
+    if settings.warm_on_startup:
+        await app.state.providers.warm_up()
+    app.state.providers.start_batching()
 
 
 @app.on_event("shutdown")
@@ -87,6 +129,8 @@ async def shutdown_event():
     Application shutdowns tasks.
     """
     logger.info(f"Shutting down {settings.app_name}")
+    
+    await app.state.providers.stop_batching()
 
 
 @app.get("/")
@@ -104,11 +148,17 @@ async def root():
     }
 
 
+# Local development launcher. uvicorn imports app.main again through the import
+# string, so module setup runs twice here; the Docker image uses the uvicorn CLI
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.gpu_mode else settings.workers,
+        timeout_keep_alive=settings.keep_alive_timeout,
         reload=settings.debug
     )
@@ -9,28 +9,133 @@ Note: This module should also function as a fixture for testing if an MCP is pre
 """
 
 import re
-from typing import Dict, Any, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 from datetime import datetime
 from ..providers.base import IntentRouter, IntentResult
 
+# RE2 runs the date/time patterns as a linear-time DFA; they use no
+# backreferences, so the stdlib engine is a drop-in fallback
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
 
 # Intent keywords and patterns for entity extraction
-APPOINTMENT_KEYWORDS = {
+APPOINTMENT_KEYWORDS = frozenset({
     'appointment', 'schedule', 'booking', 'book', 'see the doctor',
     'visit', 'consultation', 'checkup', 'check-up', 'meeting', 'arrangement',
     'assignation'
-}
+})
 
-FINANCIAL_KEYWORDS = {
+FINANCIAL_KEYWORDS = frozenset({
     'insurance', 'coverage', 'copay', 'co-pay', 'deductible', 'bill',
     'payment', 'cost', 'price', 'charge', 'fee', 'financial', 'money'
-}
+})
 
-GENERAL_KEYWORDS = {
+GENERAL_KEYWORDS = frozenset({
     'hours', 'location', 'address', 'phone', 'contact', 'directions',
     'parking', 'questions', 'information', 'help'
+})
+
+# Keyword sets per intent, in tie-breaking order
+INTENT_KEYWORDS = {
+    "APPOINTMENT_SCHEDULING": APPOINTMENT_KEYWORDS,
+    "FINANCIAL_CLEARANCE": FINANCIAL_KEYWORDS,
+    "GENERAL_INQUIRY": GENERAL_KEYWORDS,
+}
+
+# Single words are matched as whole tokens; the few phrases
+# (e.g. 'see the doctor') are still looked up as substrings
+MULTIWORD_KEYWORDS = {
+    intent: tuple(keyword for keyword in keywords if ' ' in keyword)
+    for intent, keywords in INTENT_KEYWORDS.items()
 }
 
+_TOKEN_RE = re.compile(r"[a-z][a-z-]+")
+
+# Endings a keyword token may carry (plurals and verb forms)
+_INFLECTIONS = ('', 's', 'es', 'ed', 'ing')
+
+
+def keyword_forms(keyword: str) -> FrozenSet[str]:
+    """
+    Returns the whole tokens a single-word keyword matches.
+    
+    Covers plurals, verb endings and a 're' prefix ('appointments',
+    'scheduling', 'reschedule'), but not unrelated words that merely start
+    with the keyword ('bill' never matches 'billion').
+    
+    Args:
+        keyword: Lowercase keyword
+        
+    Returns:
+        Set of matching tokens
+    """
+    forms = {keyword + ending for ending in _INFLECTIONS}
+    if keyword.endswith('e') and not keyword.endswith('ee'):
+        # schedule -> scheduled, scheduling
+        forms.update((keyword[:-1] + 'ed', keyword[:-1] + 'ing'))
+    return frozenset(forms | {'re' + form for form in forms})
+
+
+# Token -> keyword it is a form of, per intent; scores count distinct keywords
+KEYWORD_FORMS = {
+    intent: {
+        form: keyword
+        for keyword in sorted(keywords, key=len, reverse=True) if ' ' not in keyword
+        for form in keyword_forms(keyword)
+    }
+    for intent, keywords in INTENT_KEYWORDS.items()
+}
+
+# Entity keywords per category as (keyword, value), highest priority first;
+# the first listed keyword found in the text decides the value
+ENTITY_KEYWORDS = {
+    'appointment_type': (
+        ('checkup', 'checkup'), ('check-up', 'checkup'), ('consultation', 'consultation'),
+    ),
+    'insurance_type': (
+        ('medicare', 'medicare'), ('medicaid', 'medicaid'),
+        ('private', 'private'), ('insurance', 'private'),
+    ),
+    'query_type': (
+        ('copay', 'copay'), ('co-pay', 'copay'), ('deductible', 'deductible'),
+        ('bill', 'billing'), ('payment', 'billing'),
+    ),
+    'inquiry_type': (
+        ('hours', 'hours'), ('open', 'hours'),
+        ('location', 'location'), ('address', 'location'), ('directions', 'location'),
+        ('phone', 'contact'), ('contact', 'contact'),
+    ),
+}
+
+# Entity categories extracted for each intent
+INTENT_ENTITIES = {
+    "APPOINTMENT_SCHEDULING": ('appointment_type',),
+    "FINANCIAL_CLEARANCE": ('insurance_type', 'query_type'),
+    "GENERAL_INQUIRY": ('inquiry_type',),
+}
+
+
+def _build_entity_forms() -> Dict[str, Tuple[Tuple[str, int, str], ...]]:
+    """
+    Maps every form of every entity keyword to its (category, priority, value) tags.
+    
+    Entity keywords follow the same whole-token rules as intent keywords.
+    """
+    tags: Dict[str, list] = {}
+    for category, keywords in ENTITY_KEYWORDS.items():
+        for priority, (keyword, value) in enumerate(keywords):
+            for form in keyword_forms(keyword):
+                tags.setdefault(form, []).append((category, priority, value))
+    return {form: tuple(form_tags) for form, form_tags in tags.items()}
+
+
+ENTITY_FORMS = _build_entity_forms()
+
 # Date-time patterns
 TIME_PATTERNS = [
     r'\b(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)\b',
@@ -43,6 +148,11 @@ DATE_PATTERNS = [
     r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})\b',
 ]
 
+# Each list compiled into one alternation, so a single scan finds the earliest
+# mention. No IGNORECASE: entities are extracted from the lowercased text.
+_TIME_RE = regex_engine.compile('|'.join(f'(?:{p})' for p in TIME_PATTERNS))
+_DATE_RE = regex_engine.compile('|'.join(f'(?:{p})' for p in DATE_PATTERNS))
+
 
 class RuleBasedIntentRouter(IntentRouter):
     """
@@ -59,12 +169,15 @@ class RuleBasedIntentRouter(IntentRouter):
         # Result: intent=APPOINTMENT_SCHEDULING, entities={'date': 'tuesday', 'time': '2pm'}
     """
     
-    def __init__(self, confidence_threshold: float = 0.6):
+    def __init__(self, confidence_threshold: float = 0.6, cache_size: int = 256):
         """        
         Args:
             confidence_threshold: Minimum confidence for intent classification
+            cache_size: Number of recent utterances whose results are cached
         """
         self.confidence_threshold = confidence_threshold
+        # Per-instance LRU so the cache isn't keyed on (or shared through) self
+        self._route_sync = functools.lru_cache(maxsize=cache_size)(self._classify)
     
     async def route(self, text: str) -> IntentResult:
         """
@@ -77,36 +190,48 @@ class RuleBasedIntentRouter(IntentRouter):
             
         Returns:
             IntentResult with classified intent and extracted entities
+            (cached results are shared, treat them as read-only)
+        """
+        return self._route_sync(text.lower())
+    
+    def clear_cache(self):
+        """
+        Drops every cached classification result.
+        """
+        self._route_sync.cache_clear()
+    
+    def _classify(self, text_lower: str) -> IntentResult:
         """
-        text_lower = text.lower()
+        Classifies lowercase text (pure function of the text, hence cacheable).
         
-        appointment_score = self._score_intent(text_lower, APPOINTMENT_KEYWORDS)
-        financial_score = self._score_intent(text_lower, FINANCIAL_KEYWORDS)
-        general_score = self._score_intent(text_lower, GENERAL_KEYWORDS)
+        Args:
+            text_lower: Lowercase user input text
+            
+        Returns:
+            IntentResult with classified intent and extracted entities
+        """
+        tokens = set(_TOKEN_RE.findall(text_lower))
+        scores = self._score_intents(tokens, text_lower)
         
-        max_score = max(appointment_score, financial_score, general_score)
+        # max() keeps the first intent on ties, so appointments win over the others
+        intent = max(scores, key=scores.get)
+        max_score = scores[intent]
         
         if max_score == 0:
             return IntentResult(
                 intent="UNKNOWN",
                 confidence=0.0,
-                entities={},
+                entities=MappingProxyType({}),
                 handoff_recommended=True,
                 reasoning="No keywords matched any known intent"
             )
         
-        if appointment_score == max_score:
-            intent = "APPOINTMENT_SCHEDULING"
-        elif financial_score == max_score:
-            intent = "FINANCIAL_CLEARANCE"
-        else:
-            intent = "GENERAL_INQUIRY"
-        
         # Normalize confidence score, this should detect accents as well (0-1)
         confidence = min(max_score / 3.0, 1.0)  # Max 3 keywords for full confidence
         
-        # Extract entities such as keywords or timestamps
-        entities = self._extract_entities(text_lower, intent)
+        # Extract entities such as keywords or timestamps; read-only because
+        # the result is cached and shared between callers
+        entities = MappingProxyType(self._extract_entities(tokens, text_lower, intent))
         
         # Recommend this control var if confidence is low
         handoff_recommended = confidence < self.confidence_threshold
@@ -121,26 +246,51 @@ class RuleBasedIntentRouter(IntentRouter):
             reasoning=reasoning
         )
     
-    def _score_intent(self, text: str, keywords: set) -> int:
+    def _score_intents(self, tokens: set, text: str) -> Dict[str, int]:
+        """
+        Counts the keyword matches of every intent.
+        
+        Args:
+            tokens: Set of words in the input text
+            text: Lowercase input text
+            
+        Returns:
+            Number of matched keywords per intent
+        """
+        # Intersections run in C over a handful of tokens, and results are
+        # cached per utterance, so there is no Python loop left worth JIT-compiling
+        return {
+            intent: self._score_intent(tokens, text, KEYWORD_FORMS[intent], MULTIWORD_KEYWORDS[intent])
+            for intent in INTENT_KEYWORDS
+        }
+    
+    def _score_intent(self, tokens: set, text: str, forms: Dict[str, str], phrases: tuple) -> int:
         """
         This helper method counts all keyword matches in text.
         
+        Tokens match keywords through their forms (see keyword_forms), so
+        'appointments' counts for 'appointment' but 'billion' not for 'bill'.
+        
         Args:
+            tokens: Set of words in the input text
             text: Lowercase input text
-            keywords: Set of keywords to match
+            forms: Token forms of the intent's keywords, mapped to the keyword
+            phrases: Multi-word keywords to look up in the text
             
         Returns:
-            Number of matched keywords
+            Number of distinct matched keywords
         """
-        return sum(1 for keyword in keywords if keyword in text)
+        matched = {forms[token] for token in tokens & forms.keys()}
+        return len(matched) + sum(1 for phrase in phrases if phrase in text)
     
-    def _extract_entities(self, text: str, intent: str) -> Dict[str, Any]:
+    def _extract_entities(self, tokens: set, text: str, intent: str) -> Dict[str, Any]:
         """
         This method extracts entities relevant to the identified intent.
 
         TODO: MCP should override manual if branches.
         
         Args:
+            tokens: Set of words in the input text
             text: Lowercase input text
             intent: Identified intent
             
@@ -157,56 +307,44 @@ class RuleBasedIntentRouter(IntentRouter):
             date_entity = self._extract_date(text)
             if date_entity:
                 entities['date'] = date_entity
-            
-            if 'checkup' in text or 'check-up' in text:
-                entities['appointment_type'] = 'checkup'
-            elif 'consultation' in text:
-                entities['appointment_type'] = 'consultation'
-        
-        elif intent == "FINANCIAL_CLEARANCE":
-            if 'medicare' in text:
-                entities['insurance_type'] = 'medicare'
-            elif 'medicaid' in text:
-                entities['insurance_type'] = 'medicaid'
-            elif 'private' in text or 'insurance' in text:
-                entities['insurance_type'] = 'private'
-            
-            if 'copay' in text or 'co-pay' in text:
-                entities['query_type'] = 'copay'
-            elif 'deductible' in text:
-                entities['query_type'] = 'deductible'
-            elif 'bill' in text or 'payment' in text:
-                entities['query_type'] = 'billing'
         
-        elif intent == "GENERAL_INQUIRY":
-            if 'hours' in text or 'open' in text:
-                entities['inquiry_type'] = 'hours'
-            elif 'location' in text or 'address' in text or 'directions' in text:
-                entities['inquiry_type'] = 'location'
-            elif 'phone' in text or 'contact' in text:
-                entities['inquiry_type'] = 'contact'
+        categories = INTENT_ENTITIES.get(intent)
+        if categories:
+            entities.update(self._match_entity_keywords(tokens, categories))
         
         return entities
     
+    def _match_entity_keywords(self, tokens: set, categories: tuple) -> Dict[str, str]:
+        """
+        Finds the highest-priority keyword of each entity category in the tokens.
+        
+        Args:
+            tokens: Set of words in the input text
+            categories: Entity categories to extract
+            
+        Returns:
+            Dictionary of category to entity value
+        """
+        best: Dict[str, tuple] = {}
+        for token in tokens & ENTITY_FORMS.keys():
+            for category, priority, value in ENTITY_FORMS[token]:
+                if category not in best or priority < best[category][0]:
+                    best[category] = (priority, value)
+        return {category: best[category][1] for category in categories if category in best}
+    
     def _extract_time(self, text: str) -> Optional[str]:
         """
-        Extract time references from text.
+        Extract time references from lowercase text.
         """
-        for pattern in TIME_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        return None
+        match = _TIME_RE.search(text)
+        return match.group(0) if match else None
     
     def _extract_date(self, text: str) -> Optional[str]:
         """
-        Extract date references from text.
+        Extract date references from lowercase text.
         """
-        for pattern in DATE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        return None
+        match = _DATE_RE.search(text)
+        return match.group(0) if match else None
     
     async def health_check(self) -> bool:
         """
@@ -218,6 +356,43 @@ class RuleBasedIntentRouter(IntentRouter):
         return True
 
 
+# Reply templates keyed on (intent, variant), filled in from the entities;
+# variant None is the intent's generic reply
+_RESPONSES = {
+    ("APPOINTMENT_SCHEDULING", "date_time"): "I can help you schedule an appointment for {date} at {time}. Let me check our availability and get you booked.",
+    ("APPOINTMENT_SCHEDULING", "date"): "I can help you schedule an appointment for {date}. What time works best for you?",
+    ("APPOINTMENT_SCHEDULING", None): "I can help you schedule an appointment. What day and time would work best for you?",
+    ("FINANCIAL_CLEARANCE", "copay"): "I can help you understand your copay. Let me look up your insurance information and provide specific details.",
+    ("FINANCIAL_CLEARANCE", "deductible"): "I can help you with deductible information. Let me check your coverage details.",
+    ("FINANCIAL_CLEARANCE", "insurance"): "I can help you with your {insurance_type} coverage questions. What specific information do you need?",
+    ("FINANCIAL_CLEARANCE", None): "I can help you with insurance and billing questions. What would you like to know?",
+    ("GENERAL_INQUIRY", "hours"): "Our office hours are Monday through Friday, 8 AM to 5 PM. We're closed on weekends and major holidays.",
+    ("GENERAL_INQUIRY", "location"): "We're located at 123 Medical Plaza Drive, Suite 100. There's ample parking available in the adjacent lot.",
+    ("GENERAL_INQUIRY", "contact"): "You can reach us at 555-0100. For urgent matters, please call our after-hours line.",
+    ("GENERAL_INQUIRY", None): "I'm here to help answer your questions. What information can I provide?",
+}
+
+_DEFAULT_RESPONSE = "I'm here to help. Could you please clarify what you need assistance with? I can help with appointments, billing, or general information."
+
+
+def _response_variant(intent: str, entities: Dict[str, Any]) -> Optional[str]:
+    """
+    Picks which reply template of an intent fits the extracted entities.
+    """
+    if intent == "APPOINTMENT_SCHEDULING":
+        if entities.get('date'):
+            return "date_time" if entities.get('time') else "date"
+    elif intent == "FINANCIAL_CLEARANCE":
+        query_type = entities.get('query_type')
+        if query_type in ('copay', 'deductible'):
+            return query_type
+        if entities.get('insurance_type'):
+            return "insurance"
+    elif intent == "GENERAL_INQUIRY":
+        return entities.get('inquiry_type')
+    return None
+
+
 def generate_response(intent_result: IntentResult) -> str:
     """
     This helper generates a natural language response based on intent classification.
@@ -236,41 +411,7 @@ def generate_response(intent_result: IntentResult) -> str:
     intent = intent_result.intent
     entities = intent_result.entities
     
-    if intent == "APPOINTMENT_SCHEDULING":
-        time_str = entities.get('time', '')
-        date_str = entities.get('date', '')
-        
-        if time_str and date_str:
-            return f"I can help you schedule an appointment for {date_str} at {time_str}. Let me check our availability and get you booked."
-        elif date_str:
-            return f"I can help you schedule an appointment for {date_str}. What time works best for you?"
-        else:
-            return "I can help you schedule an appointment. What day and time would work best for you?"
-    
-    elif intent == "FINANCIAL_CLEARANCE":
-        query_type = entities.get('query_type', '')
-        insurance_type = entities.get('insurance_type', '')
-        
-        if query_type == 'copay':
-            return "I can help you understand your copay. Let me look up your insurance information and provide specific details."
-        elif query_type == 'deductible':
-            return "I can help you with deductible information. Let me check your coverage details."
-        elif insurance_type:
-            return f"I can help you with your {insurance_type} coverage questions. What specific information do you need?"
-        else:
-            return "I can help you with insurance and billing questions. What would you like to know?"
-    
-    elif intent == "GENERAL_INQUIRY":
-        inquiry_type = entities.get('inquiry_type', '')
-        
-        if inquiry_type == 'hours':
-            return "Our office hours are Monday through Friday, 8 AM to 5 PM. We're closed on weekends and major holidays."
-        elif inquiry_type == 'location':
-            return "We're located at 123 Medical Plaza Drive, Suite 100. There's ample parking available in the adjacent lot."
-        elif inquiry_type == 'contact':
-            return "You can reach us at 555-0100. For urgent matters, please call our after-hours line."
-        else:
-            return "I'm here to help answer your questions. What information can I provide?"
-    
-    else:
-        return "I'm here to help. Could you please clarify what you need assistance with? I can help with appointments, billing, or general information."
+    template = _RESPONSES.get((intent, _response_variant(intent, entities)))
+    if template is None:
+        template = _RESPONSES.get((intent, None), _DEFAULT_RESPONSE)
+    return template.format_map(entities)
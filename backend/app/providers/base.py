@@ -9,11 +9,15 @@ without changing application logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional, Any, Dict
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import AsyncIterator, BinaryIO, Optional, Any, Dict, List, Mapping, Union
 
 
-class TranscriptionResult(BaseModel):
+# Provider results are plain slotted dataclasses: they are built on every
+# request and only turned into Pydantic schemas at the API boundary
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TranscriptionResult:
     """
     Result from speech-to-text transcription.
     """
@@ -23,7 +27,8 @@ class TranscriptionResult(BaseModel):
     duration_ms: int
     
     
-class PartialTranscription(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PartialTranscription:
     """
     Partial transcription for streaming STT.
     """
@@ -45,6 +50,10 @@ class STTProvider(ABC):
         print(result.text)
     """
     
+    # True when transcribe_batch runs real batched inference; the micro-batching
+    # scheduler is only put in front of providers that set it
+    supports_batching: bool = False
+    
     @abstractmethod
     async def transcribe(self, audio: BinaryIO, language: Optional[str] = None) -> TranscriptionResult:
         """
@@ -62,6 +71,42 @@ class STTProvider(ABC):
         """
         pass
     
+    async def transcribe_batch(
+        self,
+        audios: List[BinaryIO],
+        language: Optional[str] = None
+    ) -> List[Union[TranscriptionResult, Exception]]:
+        """
+        Transcribe several audio files at once.
+        
+        Providers able to process requests together should override this;
+        the default transcribes each file in turn. A file that fails doesn't
+        fail the others: its slot holds the exception instead of a result.
+        
+        Args:
+            audios: Audio file-like objects (WAV, MP3, etc.)
+            language: Optional language code shared by the batch
+            
+        Returns:
+            One TranscriptionResult or exception per input, in the same order
+        """
+        results: List[Union[TranscriptionResult, Exception]] = []
+        for audio in audios:
+            try:
+                results.append(await self.transcribe(audio, language=language))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    async def warm_up(self):
+        """
+        Prepare the provider so the first real request runs at full speed.
+        
+        The default does nothing; providers with lazy model loading or
+        first-call compilation should run a small dummy request here.
+        """
+        pass
+    
     @abstractmethod
     async def health_check(self) -> bool:
         """
@@ -108,6 +153,40 @@ class TTSProvider(ABC):
         """
         pass
     
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Convert text to speech, yielding WAV audio as it is produced.
+        
+        Providers able to stream should override this; the default yields
+        the complete result of synthesize() as a single chunk.
+        
+        Args:
+            text: Text to synthesize
+            voice: Optional voice identifier
+            speed: Speech rate (0.5 = half speed, 2.0 = double speed)
+            
+        Yields:
+            WAV audio chunks (the first one starts with the WAV header)
+            
+        Raises:
+            ProviderException: If synthesis fails
+        """
+        yield await self.synthesize(text, voice=voice, speed=speed)
+    
+    async def warm_up(self):
+        """
+        Prepare the provider so the first real request runs at full speed.
+        
+        The default does nothing; providers with lazy model loading should
+        synthesize a short phrase here.
+        """
+        pass
+    
     @abstractmethod
     async def health_check(self) -> bool:
         """
@@ -119,13 +198,16 @@ class TTSProvider(ABC):
         pass
 
 
-class IntentResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class IntentResult:
     """
     Results from the intent recognition process.
+    
+    Frozen because routers may cache and share results between requests.
     """
     intent: str
     confidence: float
-    entities: Dict[str, Any]
+    entities: Mapping[str, Any]
     handoff_recommended: bool
     reasoning: Optional[str] = None
 
@@ -158,6 +240,14 @@ class IntentRouter(ABC):
         """
         pass
     
+    async def warm_up(self):
+        """
+        Prepare the router so the first real request runs at full speed.
+        
+        The default does nothing.
+        """
+        pass
+    
     @abstractmethod
     async def health_check(self) -> bool:
         """
@@ -0,0 +1,197 @@
+"""
+Dynamic micro-batching module for STT requests.
+
+This module groups concurrent transcription requests that arrive within a
+short accumulation window and hands them to the STT provider together, so
+parallel capacity is used instead of processing requests one by one.
+"""
+
+import io
+import asyncio
+import bisect
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
+
+from ..providers.base import STTProvider, TranscriptionResult
+from ..telemetry.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Audio length is estimated from the payload size (16 kHz, 16-bit mono WAV)
+BYTES_PER_SECOND = 32000
+
+# Length bucket boundaries in seconds: <10s, 10-30s, >30s
+LENGTH_BUCKETS_S = (10, 30)
+
+
+def length_bucket(audio: BinaryIO) -> int:
+    """
+    Returns the length bucket index of an audio file.
+
+    Args:
+        audio: Seekable audio file-like object
+
+    Returns:
+        Bucket index (0 = short, 1 = medium, 2 = long)
+    """
+    audio.seek(0, io.SEEK_END)
+    size = audio.tell()
+    audio.seek(0)
+    return bisect.bisect(LENGTH_BUCKETS_S, size / BYTES_PER_SECOND)
+
+
+class BatchScheduler:
+    """
+    Scheduler class accumulating STT requests into batches.
+
+    Requests are queued with a future; a background task waits up to
+    ``max_wait_ms`` (or until ``max_batch_size`` requests are queued), groups
+    them by language and length bucket to keep similar clips together, and
+    resolves each future with its own result.
+
+    Example:
+        scheduler = BatchScheduler(provider, max_batch_size=8, max_wait_ms=50)
+        scheduler.start()
+        result = await scheduler.submit(audio_io, language="en")
+    """
+
+    def __init__(self, provider: STTProvider, max_batch_size: int = 8, max_wait_ms: int = 50):
+        """
+        Initialize the scheduler (the loop is started separately).
+
+        Args:
+            provider: STT provider used to transcribe batches
+            max_batch_size: Maximum number of requests per batch
+            max_wait_ms: Maximum time to wait for a batch to fill up
+        """
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dispatching: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the batching loop is active.
+        """
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """
+        Starts the background batching loop on the running event loop.
+        """
+        if self.is_running:
+            return
+        self.queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"STT batching started (max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait_ms})"
+        )
+
+    async def stop(self):
+        """
+        Stops the batching loop, cancelling queued and in-flight requests.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Dispatches already handed to the provider cancel their own futures
+        dispatching = list(self._dispatching)
+        for task in dispatching:
+            task.cancel()
+        await asyncio.gather(*dispatching, return_exceptions=True)
+
+        while not self.queue.empty():
+            _, _, future = self.queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def submit(self, audio: BinaryIO, language: Optional[str] = None) -> TranscriptionResult:
+        """
+        Queues an audio file for transcription and waits for its result.
+
+        When the batching loop isn't running, the audio is transcribed directly.
+
+        Args:
+            audio: Seekable audio file-like object
+            language: Optional language code
+
+        Returns:
+            TranscriptionResult for this audio
+
+        Raises:
+            ProviderException: If transcription fails
+        """
+        if not self.is_running:
+            return await self.provider.transcribe(audio, language=language)
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((audio, language, future))
+        return await future
+
+    async def _run(self):
+        """
+        Collects queued requests into batches and dispatches them.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: Dict[Tuple[Optional[str], int], List] = {}
+            for item in batch:
+                audio, language, _ = item
+                groups.setdefault((language, length_bucket(audio)), []).append(item)
+
+            for (language, _), items in groups.items():
+                task = asyncio.create_task(self._dispatch(items, language))
+                self._dispatching.add(task)
+                task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, items: List, language: Optional[str]):
+        """
+        Transcribes one group of requests and resolves their futures.
+
+        Each future gets its own result or exception, so one bad upload
+        doesn't fail (or leak its error to) the rest of the group.
+        """
+        try:
+            results = await self.provider.transcribe_batch(
+                [audio for audio, _, _ in items],
+                language=language
+            )
+        except asyncio.CancelledError:
+            for _, _, future in items:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,180 @@
+"""
+Provider registry module for sharing provider instances across requests.
+
+This module holds a single instance of each provider (STT, TTS, intent) for
+the lifetime of the application, so model weights and provider setup are paid
+for once per process instead of on every request.
+"""
+
+import os
+from typing import Optional
+
+from ..core.config import Settings, settings
+from ..providers.base import STTProvider, TTSProvider, IntentRouter, ProviderException
+from ..providers.batching import BatchScheduler
+from ..providers.stt_whisper import FasterWhisperProvider
+from ..providers.tts_piper import PiperTTSProvider
+from ..nlu.intent_router import RuleBasedIntentRouter
+from ..telemetry.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def whisper_cpu_threads(config: Settings) -> int:
+    """
+    Returns the CTranslate2 threads per Whisper worker.
+
+    An explicit whisper_cpu_threads is used as-is; 0 splits the cores evenly
+    over every transcription thread in every server process, so they never
+    compete for the same cores.
+    """
+    if config.whisper_cpu_threads > 0:
+        return config.whisper_cpu_threads
+    processes = 1 if config.gpu_mode else config.workers
+    return max(1, (os.cpu_count() or 1) // (processes * config.whisper_num_workers))
+
+
+class ProviderRegistry:
+    """
+    Registry class that lazily creates and caches the provider singletons.
+
+    Faster Whisper models are safe to share between concurrent requests, and
+    the Piper and rule-based providers hold no per-request state, so a single
+    shared instance of each is enough (no object pool required).
+
+    Example:
+        providers = ProviderRegistry()
+        providers.load()
+        result = await providers.stt.transcribe(audio)
+    """
+
+    def __init__(
+        self,
+        config: Settings = settings,
+        stt: Optional[STTProvider] = None,
+        tts: Optional[TTSProvider] = None
+    ):
+        """
+        Initialize the registry without creating any provider yet.
+
+        Args:
+            config: Application settings used to build the providers
+            stt: Optional STT provider to use instead of building Faster Whisper
+            tts: Optional TTS provider to use instead of building Piper
+        """
+        self.config = config
+        self._stt: Optional[STTProvider] = stt
+        self._tts: Optional[TTSProvider] = tts
+        self._intent: Optional[IntentRouter] = None
+        self._stt_batcher: Optional[BatchScheduler] = None
+
+    @property
+    def stt(self) -> STTProvider:
+        """
+        Shared STT provider (created on first access).
+
+        Raises:
+            ProviderException: If the STT model cannot be loaded
+        """
+        if self._stt is None:
+            self._stt = FasterWhisperProvider(
+                model_size=self.config.whisper_model_size,
+                device="cuda" if self.config.gpu_mode else "cpu",
+                compute_type=self.config.whisper_compute_type,
+                num_workers=self.config.whisper_num_workers,
+                cpu_threads=whisper_cpu_threads(self.config),
+                beam_size=self.config.whisper_beam_size
+            )
+        return self._stt
+
+    @property
+    def stt_batcher(self) -> BatchScheduler:
+        """
+        Shared micro-batching scheduler in front of the STT provider.
+
+        Raises:
+            ProviderException: If the STT model cannot be loaded
+        """
+        if self._stt_batcher is None:
+            self._stt_batcher = BatchScheduler(
+                self.stt,
+                max_batch_size=self.config.stt_batch_max_size,
+                max_wait_ms=self.config.stt_batch_max_wait_ms
+            )
+        return self._stt_batcher
+
+    @property
+    def tts(self) -> TTSProvider:
+        """
+        Shared TTS provider (created on first access).
+        """
+        if self._tts is None:
+            self._tts = PiperTTSProvider(
+                model_path=self.config.piper_model_path,
+                voice=self.config.piper_voice,
+                cache_size=self.config.tts_cache_size
+            )
+        return self._tts
+
+    @property
+    def intent(self) -> IntentRouter:
+        """
+        Shared intent router (created on first access).
+        """
+        if self._intent is None:
+            self._intent = RuleBasedIntentRouter(
+                confidence_threshold=self.config.intent_confidence_threshold,
+                cache_size=self.config.intent_cache_size
+            )
+        return self._intent
+
+    def load(self):
+        """
+        Eagerly creates every provider so the first request doesn't pay for it.
+
+        Providers that fail to initialize are logged and retried on next access.
+        """
+        for name in ("stt", "tts", "intent"):
+            try:
+                getattr(self, name)
+            except ProviderException as e:
+                logger.warning(f"Provider '{name}' unavailable at startup: {e}")
+
+    async def warm_up(self):
+        """
+        Runs a dummy request through each loaded provider.
+
+        Failures are logged only, a provider that can't warm up will still
+        be tried by real requests.
+        """
+        for name, provider in (("stt", self._stt), ("tts", self._tts), ("intent", self._intent)):
+            if provider is None:
+                continue
+            try:
+                await provider.warm_up()
+            except Exception as e:
+                logger.warning(f"Provider '{name}' warm-up failed: {e}")
+
+    def start_batching(self):
+        """
+        Starts the STT batching loop (must run inside the event loop).
+
+        Only when stt_batching_enabled is set and the STT provider supports
+        batching; otherwise requests go straight to the provider.
+        """
+        if not self.config.stt_batching_enabled:
+            return
+        try:
+            if not self.stt.supports_batching:
+                logger.info("STT batching not started: provider does not batch")
+                return
+            self.stt_batcher.start()
+        except ProviderException as e:
+            logger.warning(f"STT batching not started: {e}")
+
+    async def stop_batching(self):
+        """
+        Stops the STT batching loop if it was started.
+        """
+        if self._stt_batcher is not None:
+            await self._stt_batcher.stop()
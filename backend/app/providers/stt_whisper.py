@@ -10,15 +10,106 @@ Currently it supports its use via API, but streaming support has to be added wit
 
 import io
 import time
-from typing import BinaryIO, Optional
-import tempfile
-import os
+import asyncio
+import functools
+from typing import BinaryIO, List, Optional, Union
+
+import numpy as np
+
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
 
 from ..providers.base import STTProvider, TranscriptionResult, ProviderException
 from ..telemetry.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Audio accepted by the provider: a file-like object, raw encoded bytes, or
+# already decoded 16 kHz mono float32 samples
+AudioInput = Union[BinaryIO, bytes, bytearray, memoryview, np.ndarray]
+
+# Sample rate Whisper models expect
+WHISPER_SAMPLE_RATE = 16000
+
+
+def decode_audio(audio: AudioInput) -> Union[BinaryIO, np.ndarray]:
+    """
+    Decodes 16 kHz audio in memory with libsndfile.
+    
+    Anything libsndfile can't read, or at another sample rate, is returned as
+    a file-like object for faster-whisper to decode (and resample) via PyAV.
+    
+    Args:
+        audio: Audio file, its raw bytes, or decoded samples
+        
+    Returns:
+        Mono float32 samples, or a seekable file-like object
+    """
+    if isinstance(audio, np.ndarray):
+        return audio
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        # BytesIO shares, rather than copies, a bytes object
+        audio = io.BytesIO(audio)
+    if sf is None:
+        return audio
+    
+    try:
+        data, sample_rate = sf.read(audio, dtype="float32", always_2d=False)
+    except RuntimeError:
+        audio.seek(0)
+        return audio
+    
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        audio.seek(0)
+        return audio
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    return data
+
+
+def resolve_compute_type(device: str, compute_type: str = "auto") -> str:
+    """
+    Picks the CTranslate2 compute type for a device.
+    
+    "auto" selects int8 on CPU and int8_float16 (INT8 weights, FP16
+    activations) on CUDA, which halves weight bandwidth compared to float16.
+    Explicit compute types are returned unchanged.
+    
+    Args:
+        device: Device name ("cpu", "cuda", "cuda:1", ...)
+        compute_type: Requested compute type or "auto"
+        
+    Returns:
+        Concrete compute type
+    """
+    if compute_type != "auto":
+        return compute_type
+    return "int8_float16" if device.startswith("cuda") else "int8"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(model_size: str, device: str, compute_type: str, num_workers: int, cpu_threads: int):
+    """
+    Loads a Whisper model once per configuration.
+    
+    Providers created with the same settings (e.g. in tests or after a
+    registry reset) share the already loaded weights.
+    """
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        num_workers=num_workers,
+        cpu_threads=cpu_threads
+    )
+
 
 class FasterWhisperProvider(STTProvider):
     """
@@ -39,18 +130,35 @@ class FasterWhisperProvider(STTProvider):
             print(result.text)
     """
     
-    def __init__(self, model_size: str = "base", device: str = "cpu", compute_type: str = "int8"):
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: str = "auto",
+        num_workers: int = 1,
+        cpu_threads: int = 0,
+        beam_size: int = 1
+    ):
         """
         Initialize Faster Whisper provider.
         
         Args:
             model_size: Model size (tiny, base, small, medium, large)
             device: Device to use ("cpu" or "cuda")
-            compute_type: Computation type ("int8", "float16", "float32")
+            compute_type: Computation type ("auto", "int8", "int8_float16",
+                "float16", "float32"); "auto" picks one from the device
+            num_workers: Number of CTranslate2 workers, i.e. how many
+                transcriptions can run in parallel from different threads
+            cpu_threads: CTranslate2 threads per worker (0 uses the library
+                default); bounds CPU use so inference doesn't starve the event loop
+            beam_size: Decoding beam size (1 is greedy, ~5x less decoder work than 5)
         """
         self.model_size = model_size
         self.device = device
-        self.compute_type = compute_type
+        self.compute_type = resolve_compute_type(device, compute_type)
+        self.num_workers = num_workers
+        self.cpu_threads = cpu_threads
+        self.beam_size = beam_size
         self.model = None
         self._initialize_model()
     
@@ -58,29 +166,30 @@ class FasterWhisperProvider(STTProvider):
         """
         Loads the Whisper model.
         """
+        if WhisperModel is None:
+            logger.error("faster-whisper not installed")
+            raise ProviderException("faster-whisper library not available")
+        
         try:
-            from faster_whisper import WhisperModel
-            
             logger.info(f"Loading Faster Whisper model: {self.model_size}")
-            self.model = WhisperModel(
+            self.model = _load_model(
                 self.model_size,
-                device=self.device,
-                compute_type=self.compute_type
+                self.device,
+                self.compute_type,
+                self.num_workers,
+                self.cpu_threads
             )
             logger.info("Faster Whisper model loaded successfully")
-        except ImportError:
-            logger.error("faster-whisper not installed")
-            raise ProviderException("faster-whisper library not available")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise ProviderException(f"Model initialization failed: {e}")
     
-    async def transcribe(self, audio: BinaryIO, language: Optional[str] = None) -> TranscriptionResult:
+    async def transcribe(self, audio: AudioInput, language: Optional[str] = None) -> TranscriptionResult:
         """
         Transcribe audio using Faster Whisper.
         
         Args:
-            audio: Audio file (WAV, MP3, etc.)
+            audio: Audio file (WAV, MP3, etc.), its raw bytes, or decoded samples
             language: Optional language code (e.g., 'en', 'es')
             
         Returns:
@@ -89,43 +198,96 @@ class FasterWhisperProvider(STTProvider):
         Raises:
             ProviderException: If transcription fails
         """
+        # Whisper inference is blocking, run it in a worker thread
+        return await asyncio.to_thread(self._transcribe_sync, audio, language)
+    
+    async def transcribe_batch(
+        self,
+        audios: List[AudioInput],
+        language: Optional[str] = None
+    ) -> List[Union[TranscriptionResult, Exception]]:
+        """
+        Transcribe a batch of audio files in parallel.
+        
+        Each file runs in its own worker thread, so up to ``num_workers``
+        transcriptions share the loaded model concurrently. A file that fails
+        (e.g. corrupt audio) doesn't fail the rest of the batch.
+        
+        Args:
+            audios: Audio files (WAV, MP3, etc.)
+            language: Optional language code shared by the batch
+            
+        Returns:
+            One TranscriptionResult or exception per input, in the same order
+        """
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(self._transcribe_sync, audio, language)
+            for audio in audios
+        ), return_exceptions=True))
+    
+    async def warm_up(self):
+        """
+        Runs one second of silence through the model.
+        
+        This pages the weights in and triggers any first-call initialization
+        so the first real request doesn't pay for it.
+        """
+        if not self.model:
+            return
+        
+        def run():
+            segments, _ = self.model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language="en",
+                beam_size=1,
+                vad_filter=False
+            )
+            for _ in segments:
+                pass
+        
+        start_time = time.time()
+        await asyncio.to_thread(run)
+        logger.info(f"Faster Whisper warm-up completed in {int((time.time() - start_time) * 1000)}ms")
+    
+    def _run_model(self, audio: AudioInput, language: Optional[str] = None):
+        """
+        Starts decoding one audio file, returning the lazy segments and info.
+        """
+        # Decoded fully in memory, no temp file round trip
+        audio = decode_audio(audio)
+        return self.model.transcribe(
+            audio,
+            language=language,
+            beam_size=self.beam_size,
+            vad_filter=True,
+        )
+    
+    def _transcribe_sync(self, audio: AudioInput, language: Optional[str] = None) -> TranscriptionResult:
+        """
+        Blocking transcription of a single audio file.
+        """
         if not self.model:
             raise ProviderException("Model not initialized")
         
         start_time = time.time()
         
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-                audio_bytes = audio.read()
-                tmp_file.write(audio_bytes)
-                tmp_path = tmp_file.name
+            segments, info = self._run_model(audio, language)
+            
+            full_text = " ".join(segment.text.strip() for segment in segments)
             
-            try:
-                segments, info = self.model.transcribe(
-                    tmp_path,
-                    language=language,
-                    beam_size=5,
-                    vad_filter=True,
-                )
-                
-                full_text = " ".join(segment.text.strip() for segment in segments)
-                
-                duration_ms = int((time.time() - start_time) * 1000)
-                
-                confidence = 0.95  
-                
-                logger.info(f"Transcription completed in {duration_ms}ms")
-                
-                return TranscriptionResult(
-                    text=full_text.strip(),
-                    confidence=confidence,
-                    language=info.language if hasattr(info, 'language') else language,
-                    duration_ms=duration_ms
-                )
+            duration_ms = int((time.time() - start_time) * 1000)
             
-            # Clean up temp files after operation succeeds
-            finally:
-                os.unlink(tmp_path)
+            confidence = 0.95  
+            
+            logger.info(f"Transcription completed in {duration_ms}ms")
+            
+            return TranscriptionResult(
+                text=full_text.strip(),
+                confidence=confidence,
+                language=info.language if hasattr(info, 'language') else language,
+                duration_ms=duration_ms
+            )
         
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
@@ -7,17 +7,90 @@ a fast, local text-to-speech system with high-quality voices.
 Note: So far, only one type of voice has been implemented to the solution.
 """
 
+import asyncio
+import collections
+import json
+import struct
 import subprocess
 import time
 import tempfile
 import os
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    from piper import PiperVoice
+except ImportError:
+    PiperVoice = None
 
 from ..providers.base import TTSProvider, ProviderException
 from ..telemetry.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# WAV data size used when streaming, since the final length is unknown upfront
+STREAMING_WAV_SIZE = 0xFFFFFFFF
+
+# Bytes of raw PCM read from Piper per streamed chunk
+STREAM_CHUNK_SIZE = 4096
+
+# Sample rate of Piper voices whose config can't be read
+DEFAULT_SAMPLE_RATE = 22050
+
+# Seconds a `piper --version` probe result is reused by health checks
+HEALTH_CHECK_TTL_S = 30
+
+
+def wav_header(sample_rate: int, data_size: int, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """
+    Builds a 44-byte PCM WAV header.
+    
+    Args:
+        sample_rate: Samples per second
+        data_size: Size of the PCM data in bytes (STREAMING_WAV_SIZE if unknown)
+        channels: Number of channels
+        bits_per_sample: Sample width in bits
+        
+    Returns:
+        WAV header bytes
+    """
+    block_align = channels * bits_per_sample // 8
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF',
+        min(36 + data_size, 0xFFFFFFFF),
+        b'WAVE',
+        b'fmt ',
+        16,                         # fmt chunk size
+        1,                          # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # Byte rate
+        block_align,
+        bits_per_sample,
+        b'data',
+        data_size
+    )
+
+
+def _build_silent_wav(sample_rate: int, duration: int) -> bytes:
+    """
+    Builds a silent 16-bit mono WAV file.
+    
+    Args:
+        sample_rate: Samples per second
+        duration: Length in seconds
+        
+    Returns:
+        WAV audio bytes
+    """
+    data_size = sample_rate * duration * 2  # 2 bytes per 16-bit sample
+    return wav_header(sample_rate, data_size) + bytes(data_size)
+
+
+# Fallback audio is always the same 2 s of silence, so it is built once;
+# bytes are immutable, so every caller can share it
+SILENT_WAV = _build_silent_wav(16000, 2)
+
 
 class PiperTTSProvider(TTSProvider):
     """
@@ -26,6 +99,10 @@ class PiperTTSProvider(TTSProvider):
     Piper is a fast, local neural text-to-speech system that produces
     high-quality speech. It's designed to run efficiently on CPU.
     
+    When the piper-tts package is importable, voices are loaded once and run
+    in-process, so requests skip the fork/exec and ONNX session setup of the
+    piper CLI; otherwise the CLI is spawned per request.
+    
     Voice models available:
     - en_US-lessac-medium: American English, clear male voice
     - en_US-amy-medium: American English, female voice
@@ -40,7 +117,8 @@ class PiperTTSProvider(TTSProvider):
         self,
         piper_executable: str = "piper",
         model_path: str = "/app/models/piper",
-        voice: str = "en_US-lessac-medium"
+        voice: str = "en_US-lessac-medium",
+        cache_size: int = 256
     ):
         """
         Initialize Piper TTS provider.
@@ -49,18 +127,32 @@ class PiperTTSProvider(TTSProvider):
             piper_executable: Path to piper binary (defaults to 'piper' in PATH)
             model_path: Directory containing voice models
             voice: Voice model name
+            cache_size: Number of synthesized WAVs kept in memory (0 disables)
         """
         self.piper_executable = piper_executable
         self.model_path = model_path
         self.voice = voice
         self.model_file = os.path.join(model_path, f"{voice}.onnx")
         self.is_available = False
+        self._sample_rates: Dict[str, int] = {}
+        self._voices: Dict[str, "PiperVoice"] = {}
+        # (time.monotonic() of the last CLI probe, its result)
+        self._last_health: Tuple[float, bool] = (float("-inf"), False)
+        # Replies come from a small set of templates, so the same texts recur
+        self.cache_size = cache_size
+        self._cache: "collections.OrderedDict[Tuple[str, str, float], bytes]" = collections.OrderedDict()
         self._check_availability()
     
     def _check_availability(self):
         """
         Checks if Piper is available and models exist.
         """
+        if PiperVoice is not None and os.path.exists(self.model_file):
+            if self._load_voice(self.model_file) is not None:
+                logger.info(f"Piper voice loaded in-process: {self.model_file}")
+                self.is_available = True
+                return
+        
         try:
             result = subprocess.run(
                 [self.piper_executable, "--help"], 
@@ -108,6 +200,19 @@ class PiperTTSProvider(TTSProvider):
             logger.warning("Piper not available, using fallback audio")
             return self._generate_fallback_audio(text)
         
+        key = (voice or self.voice, text, speed)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        audio_bytes = await self._synthesize_uncached(text, voice, start_time)
+        self._cache_put(key, audio_bytes)
+        return audio_bytes
+    
+    async def _synthesize_uncached(self, text: str, voice: Optional[str], start_time: float) -> bytes:
+        """
+        Runs Piper for one text (in-process voice or CLI).
+        """
         try:
             voice_model = voice or self.voice
             model_file = os.path.join(self.model_path, f"{voice_model}.onnx")
@@ -116,6 +221,17 @@ class PiperTTSProvider(TTSProvider):
                 logger.warning(f"Model file not found: {model_file}, using fallback")
                 return self._generate_fallback_audio(text)
             
+            piper_voice = self._load_voice(model_file)
+            if piper_voice is not None:
+                pcm = await asyncio.to_thread(
+                    lambda: b"".join(piper_voice.synthesize_stream_raw(text))
+                )
+                
+                duration_ms = int((time.time() - start_time) * 1000)
+                logger.info(f"TTS synthesis completed in {duration_ms}ms")
+                
+                return wav_header(piper_voice.config.sample_rate, len(pcm)) + pcm
+            
             with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_output:
                 output_path = tmp_output.name
             
@@ -160,11 +276,217 @@ class PiperTTSProvider(TTSProvider):
             logger.error(f"TTS synthesis failed: {e}")
             raise ProviderException(f"TTS error: {e}")
     
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """
+        This method streams speech from Piper as it is synthesized.
+        
+        Piper is run with --output_raw so PCM is read from its stdout while
+        synthesis is still running; a WAV header with an open-ended data size
+        is sent in front of the first chunk.
+        
+        Args:
+            text: Text to synthesize
+            voice: Optional voice override
+            speed: Speech rate (not implemented in basic Piper)
+            
+        Yields:
+            WAV audio chunks (the first one starts with the WAV header)
+            
+        Raises:
+            ProviderException: If synthesis fails
+        """
+        if not self.is_available:
+            logger.warning("Piper not available, using fallback audio")
+            yield self._generate_fallback_audio(text)
+            return
+        
+        key = (voice or self.voice, text, speed)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        voice_model = voice or self.voice
+        model_file = os.path.join(self.model_path, f"{voice_model}.onnx")
+        
+        if not os.path.exists(model_file):
+            logger.warning(f"Model file not found: {model_file}, using fallback")
+            yield self._generate_fallback_audio(text)
+            return
+        
+        piper_voice = self._load_voice(model_file)
+        if piper_voice is not None:
+            async for chunk in self._stream_voice(piper_voice, text, key):
+                yield chunk
+            return
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.piper_executable,
+                "--model", model_file,
+                "--output_raw",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            logger.error("Piper executable or model not found")
+            yield self._generate_fallback_audio(text)
+            return
+        
+        try:
+            process.stdin.write(text.encode())
+            await process.stdin.drain()
+            process.stdin.close()
+            
+            # The header goes out with the first PCM chunk, so a Piper failure
+            # before any audio is produced is still reported as an error
+            sample_rate = self._sample_rate(model_file)
+            header = wav_header(sample_rate, STREAMING_WAV_SIZE)
+            pcm = []
+            
+            while True:
+                chunk = await asyncio.wait_for(process.stdout.read(STREAM_CHUNK_SIZE), timeout=15)
+                if not chunk:
+                    break
+                pcm.append(chunk)
+                if header:
+                    chunk, header = header + chunk, b""
+                yield chunk
+            
+            returncode = await asyncio.wait_for(process.wait(), timeout=15)
+            if returncode != 0:
+                logger.error(f"Piper failed with exit code {returncode}")
+                raise ProviderException(f"Piper synthesis failed with exit code {returncode}")
+            
+            self._cache_put(key, self._finished_wav(sample_rate, pcm))
+            
+            if header:
+                # Piper produced no audio, send a valid empty WAV
+                yield wav_header(sample_rate, 0)
+        
+        except asyncio.TimeoutError:
+            logger.error("Piper synthesis timed out")
+            raise ProviderException("TTS synthesis timeout")
+        
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+    
+    async def warm_up(self):
+        """
+        Synthesizes a short phrase so the voice model is paged in.
+        """
+        if not self.is_available:
+            return
+        
+        start_time = time.time()
+        await self.synthesize("Hello.")
+        logger.info(f"Piper warm-up completed in {int((time.time() - start_time) * 1000)}ms")
+    
+    async def _stream_voice(
+        self,
+        piper_voice: "PiperVoice",
+        text: str,
+        key: Tuple[str, str, float]
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams WAV audio from an in-process voice, one sentence per chunk.
+        
+        The finished WAV is cached under key once every sentence is synthesized.
+        """
+        sample_rate = piper_voice.config.sample_rate
+        sentences = iter(piper_voice.synthesize_stream_raw(text))
+        header = wav_header(sample_rate, STREAMING_WAV_SIZE)
+        pcm = []
+        
+        try:
+            while True:
+                # Each sentence is synthesized in a worker thread
+                chunk = await asyncio.to_thread(next, sentences, None)
+                if chunk is None:
+                    break
+                pcm.append(chunk)
+                if header:
+                    chunk, header = header + chunk, b""
+                yield chunk
+        except Exception as e:
+            logger.error(f"TTS synthesis failed: {e}")
+            raise ProviderException(f"TTS error: {e}")
+        
+        self._cache_put(key, self._finished_wav(sample_rate, pcm))
+        
+        if header:
+            yield wav_header(sample_rate, 0)
+    
+    @staticmethod
+    def _finished_wav(sample_rate: int, pcm: List[bytes]) -> bytes:
+        """
+        Builds a complete WAV from streamed PCM chunks, with the real data size.
+        """
+        data = b"".join(pcm)
+        return wav_header(sample_rate, len(data)) + data
+    
+    def _cache_get(self, key: Tuple[str, str, float]) -> Optional[bytes]:
+        """
+        Returns cached WAV bytes for (voice, text, speed), marking them recently used.
+        """
+        audio_bytes = self._cache.get(key)
+        if audio_bytes is not None:
+            self._cache.move_to_end(key)
+        return audio_bytes
+    
+    def _cache_put(self, key: Tuple[str, str, float], audio_bytes: bytes):
+        """
+        Stores WAV bytes, evicting the least recently used entry when full.
+        """
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = audio_bytes
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _load_voice(self, model_file: str) -> Optional["PiperVoice"]:
+        """
+        Returns the in-process voice for a model file, loading it on first use.
+        
+        Returns:
+            Loaded voice, or None if piper-tts is missing or the model can't be loaded
+        """
+        if PiperVoice is None:
+            return None
+        if model_file not in self._voices:
+            try:
+                self._voices[model_file] = PiperVoice.load(model_file)
+            except Exception as e:
+                logger.warning(f"Could not load Piper voice {model_file}: {e}")
+                return None
+        return self._voices[model_file]
+    
+    def _sample_rate(self, model_file: str) -> int:
+        """
+        Returns the sample rate of a voice from its .onnx.json config.
+        """
+        if model_file not in self._sample_rates:
+            try:
+                with open(f"{model_file}.json") as f:
+                    self._sample_rates[model_file] = json.load(f)["audio"]["sample_rate"]
+            except (OSError, KeyError, ValueError):
+                self._sample_rates[model_file] = DEFAULT_SAMPLE_RATE
+        return self._sample_rates[model_file]
+    
     def _generate_fallback_audio(self, text: str) -> bytes:
         """
         This method generates simple fallback audio when Piper is unavailable.
         
-        This creates a minimal WAV file with silence for demo purposes.
+        This returns a minimal WAV file with silence for demo purposes.
         In production, you might return an error or use a cloud TTS fallback.
         
         Args:
@@ -174,37 +496,7 @@ class PiperTTSProvider(TTSProvider):
             Silent WAV audio bytes
         """
         logger.warning("Using fallback silent audio (Piper unavailable)")
-        
-        sample_rate = 16000
-        duration = 2
-        num_samples = sample_rate * duration
-        
-        # This is based in data chunks for monostereo WAV files
-        wav_header = bytes([
-            0x52, 0x49, 0x46, 0x46,  # "RIFF"
-            0x00, 0x00, 0x00, 0x00,  # File size (placeholder)
-            0x57, 0x41, 0x56, 0x45,  # "WAVE"
-            0x66, 0x6D, 0x74, 0x20,  # "fmt "
-            0x10, 0x00, 0x00, 0x00,  # Chunk size (16)
-            0x01, 0x00,              # Audio format (PCM)
-            0x01, 0x00,              # Channels (mono)
-            0x80, 0x3E, 0x00, 0x00,  # Sample rate (16000)
-            0x00, 0x7D, 0x00, 0x00,  # Byte rate
-            0x02, 0x00,              # Block align
-            0x10, 0x00,              # Bits per sample (16)
-            0x64, 0x61, 0x74, 0x61,  # "data"
-            0x00, 0x00, 0x00, 0x00,  # Data size (placeholder)
-        ])
-        
-        audio_data = bytes(num_samples * 2)  # 2 bytes per 16-bit sample
-        file_size = len(wav_header) + len(audio_data) - 8
-        data_size = len(audio_data)
-        
-        wav_header = bytearray(wav_header)
-        wav_header[4:8] = file_size.to_bytes(4, 'little')
-        wav_header[40:44] = data_size.to_bytes(4, 'little')
-        
-        return bytes(wav_header) + audio_data
+        return SILENT_WAV
     
     async def health_check(self) -> bool:
         """
@@ -213,12 +505,24 @@ class PiperTTSProvider(TTSProvider):
         Returns:
             True if Piper is available, False otherwise
         """
+        if self._voices:
+            return True
+        
+        # Liveness probes call this every few seconds, don't fork piper each time
+        now = time.monotonic()
+        if now - self._last_health[0] < HEALTH_CHECK_TTL_S:
+            return self._last_health[1]
+        
         try:
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 [self.piper_executable, "--version"],
                 capture_output=True,
-                timeout=5
+                timeout=1
             )
-            return result.returncode == 0
+            healthy = result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            healthy = False
+        
+        self._last_health = (now, healthy)
+        return healthy
@@ -5,16 +5,53 @@ This module sets up JSON-formatted logging messages with request IDs for tracing
 requests through the entire transformation pipeline.
 """
 
+import atexit
+import functools
 import logging
+import queue
+import random
 import sys
-import json
-from typing import Optional
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO, Dict, Optional
 from contextvars import ContextVar
-from datetime import datetime
 
+import orjson
 
+
+# Holds the same string object returned to the client (response body and
+# X-Request-ID), so logging it needs no conversion or copy
 request_id_ctx: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 
+# Background listener writing queued records, and the root handler feeding
+# it, both installed by setup_logging
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+# Last formatted second as (epoch second, "YYYY-MM-DDTHH:MM:SS")
+_second_cache = (-1, "")
+
+
+def format_timestamp(created: float) -> str:
+    """
+    Formats an epoch timestamp as UTC ISO 8601 with microseconds.
+    
+    The date and time part is formatted at most once per second, records
+    logged within the same second only append their microseconds.
+    
+    Args:
+        created: Seconds since the epoch (e.g. LogRecord.created)
+        
+    Returns:
+        Timestamp such as "2024-01-01T12:00:00.123456Z"
+    """
+    global _second_cache
+    second = int(created)
+    if _second_cache[0] != second:
+        _second_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    microseconds = min(round((created - second) * 1_000_000), 999_999)
+    return f"{_second_cache[1]}.{microseconds:06d}Z"
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -27,53 +64,181 @@ class StructuredFormatter(logging.Formatter):
         """
         Formats log records as JSON.
         """
+        # default=str keeps odd extra values (UUIDs, paths...) from failing the record
+        return orjson.dumps(self.to_dict(record), default=str).decode()
+    
+    def to_dict(self, record: logging.LogRecord) -> dict:
+        """
+        Returns the structured fields of a log record.
+        """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "request_id": request_id_ctx.get(),
+            # Queued records carry the request ID captured on the request's thread
+            "request_id": getattr(record, "request_id", None) or request_id_ctx.get(),
         }
         
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
         
         if hasattr(record, 'extra_fields'):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data)
+        return log_data
 
 
-def setup_logging(debug: bool = False):
+class FastJsonHandler(logging.Handler):
+    """
+    Handler class writing records as newline-delimited JSON bytes.
+    
+    Records are serialized straight to UTF-8 bytes with the newline appended
+    and written to the binary stream in one call, skipping the str round-trip
+    and the separate terminator write of a StreamHandler.
+    """
+    
+    def __init__(self, stream: Optional[BinaryIO] = None):
+        """
+        Args:
+            stream: Binary stream to write to (defaults to stdout's buffer)
+        """
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stdout.buffer
+        self.formatter = StructuredFormatter()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(orjson.dumps(
+                self.formatter.to_dict(record), default=str, option=orjson.OPT_APPEND_NEWLINE
+            ))
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+# Plain formatter used to render tracebacks before records are queued
+_exception_formatter = logging.Formatter()
+
+
+class RequestContextQueueHandler(QueueHandler):
+    """
+    Queue handler class that resolves per-request state before enqueueing.
+    
+    The listener thread formats records later, outside the request's context,
+    so the request ID, the message arguments and the traceback are resolved
+    here; structured formatting itself still happens on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Returns a copy of the record that is safe to format on another thread.
+        """
+        record = logging.makeLogRecord(record.__dict__)
+        record.request_id = request_id_ctx.get()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Filter class keeping a random fraction of low-level records.
+    
+    Records at WARNING and above always pass; DEBUG and INFO records are kept
+    with their configured probability, cutting formatting and output volume
+    under load.
+    
+    Example:
+        handler.addFilter(SamplingFilter({logging.DEBUG: 0.01, logging.INFO: 0.1}))
+    """
+    
+    def __init__(self, rates: Dict[int, float]):
+        """
+        Args:
+            rates: Fraction of records kept per level (missing levels keep all)
+        """
+        super().__init__()
+        self.rates = rates
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(record.levelno, 1.0)
+        return rate >= 1.0 or random.random() < rate
+
+
+def _stop_queue_listener():
+    """
+    Stops the current queue listener, flushing queued records (idempotent).
+    """
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+# Registered once; stops whichever listener is current at exit
+atexit.register(_stop_queue_listener)
+
+
+def setup_logging(debug: bool = False, sample_rates: Optional[Dict[int, float]] = None):
     """
     This configures application logging.
     
     Args:
         debug: Enable debug-level logging within the pipeline
+        sample_rates: Optional fraction of records kept per level below WARNING
         
     Example:
         setup_logging(debug=True)
         logger = logging.getLogger(__name__)
         logger.info("Application started")
     """
+    global _queue_listener, _queue_handler
     level = logging.DEBUG if debug else logging.INFO
+    root_logger = logging.getLogger()
     
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(StructuredFormatter())
+    # Reconfiguring replaces the previous handler and listener instead of
+    # stacking a second handler on a queue nobody drains
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+    _stop_queue_listener()
+    
+    handler = FastJsonHandler()
+    
+    # Request handlers only enqueue records; a single background thread
+    # formats them and writes to stdout, so requests never wait on the I/O lock
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+    
+    _queue_handler = RequestContextQueueHandler(log_queue)
+    if sample_rates and any(rate < 1.0 for rate in sample_rates.values()):
+        # Sampled out records are dropped before they are copied and queued
+        _queue_handler.addFilter(SamplingFilter(sample_rates))
     
-    root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_queue_handler)
     
     # This reduces noise from third-party libraries when accessing the streaming websocket
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     This gets a logger instance with structured formatting.
     
+    Loggers are singletons, so the instance is cached per name and repeated
+    calls skip the logging module's lock and registry lookup.
+    
     Args:
         name: Any logger name (typically __name__)
         
@@ -96,5 +261,9 @@ def log_with_timing(logger: logging.Logger, message: str, duration_ms: int, **ex
     Example:
         log_with_timing(logger, "STT completed", duration_ms=1234, confidence=0.95)
     """
-    extra_fields = {"duration_ms": duration_ms, **extra}
-    logger.info(message, extra={"extra_fields": extra_fields})
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    # **extra is already a fresh dict, reuse it instead of copying
+    extra["duration_ms"] = duration_ms
+    logger.info(message, extra={"extra_fields": extra})
@@ -0,0 +1,60 @@
+"""
+Concurrency limiting utilities.
+
+This module provides a small admission-control helper used to bound how many
+expensive jobs (e.g. STT transcriptions) run at once, and to reject new work
+early when too many requests are already waiting.
+"""
+
+import asyncio
+from typing import Optional
+
+
+class ConcurrencyLimiter:
+    """
+    Async context manager allowing at most ``max_concurrent`` holders at once.
+
+    It also tracks how many callers are waiting for a slot, so handlers can
+    fail fast (e.g. with 429) instead of queueing without bound.
+
+    Example:
+        limiter = ConcurrencyLimiter(max_concurrent=4, max_queue=16)
+        if limiter.saturated:
+            raise HTTPException(status_code=429)
+        async with limiter:
+            result = await run_job()
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: Optional[int] = None):
+        """
+        Args:
+            max_concurrent: Maximum number of jobs running at the same time
+            max_queue: Maximum number of waiting jobs before saturation
+                (None means waiting is never considered saturated)
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Whether all slots are taken and the wait queue is full.
+        """
+        return (
+            self.max_queue is not None
+            and self._semaphore.locked()
+            and self.waiting >= self.max_queue
+        )
+
+    async def __aenter__(self):
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
@@ -9,20 +9,197 @@ as helpers within the codebase.
 """
 
 import re
-from typing import List, Tuple
+import functools
+from typing import Iterable, List, Optional, Tuple
 
+__all__ = [
+    "PII_LABELS",
+    "redact_phone_numbers",
+    "redact_ssn",
+    "redact_email",
+    "redact_names",
+    "redact_transcript",
+    "redact_batch",
+    "get_redacted_entities",
+]
 
-# Regex patterns for common PII
-PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+# The ASCII scanners run on RE2 when available: a linear-time DFA with no
+# backtracking blowups on long or adversarial transcripts. The patterns only
+# use syntax both engines share, so the stdlib is a drop-in fallback.
+# PCRE2 with JIT was measured against this path and not adopted: barely faster
+# on PII-dense text, where the label callback dominates, and 5-8x slower on
+# transcripts without PII, the common case.
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+# Hyperscan (SIMD multi-pattern matching) backs redact_batch when installed;
+# it is an optional dependency, not listed in requirements.txt
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Regex patterns for common PII. The phone pattern branches on the first
+# separator so a failed match never retries the other optional-separator
+# layouts, and the email domain is dot-separated labels rather than a run that
+# may swallow dots and has to give them back.
+PHONE_PATTERN = re.compile(r'\b\d{3}(?:[-.]\d{3}[-.]?\d{4}|\d{3}[-.]?\d{4})\b')
 SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
-EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,}\b')
 DATE_PATTERN = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b')
 
 # Common first names (abbreviated list for demo, this can be scraped with the MCP implementation)
-COMMON_NAMES = {
+COMMON_NAMES = frozenset({
     'john', 'mary', 'james', 'patricia', 'robert', 'jennifer', 'michael', 
     'linda', 'william', 'elizabeth', 'david', 'barbara', 'richard', 'susan',
     'joseph', 'jessica', 'thomas', 'sarah', 'charles', 'karen'
+})
+
+# All names in one alternation (longest first), matched as whole words in a
+# single scan instead of a lookup per word
+_NAME_RE = re.compile(
+    rf"\b(?:{'|'.join(sorted(COMMON_NAMES, key=len, reverse=True))})\b", re.IGNORECASE
+)
+
+# Placeholder used for each PII type
+PII_LABELS = {
+    'phone': '[PHONE]',
+    'ssn': '[SSN]',
+    'email': '[EMAIL]',
+    'date': '[DATE]',
+    'name': '[NAME]',
+}
+
+# Characters at least one of which every match of a PII type contains; text
+# without any of them skips the regex engine entirely
+_DIGITS = '0123456789'
+_LITERALS = {
+    'phone': _DIGITS,
+    'ssn': _DIGITS,
+    'email': '@',
+    'date': _DIGITS,
+}
+
+
+def _may_contain(text: str, literals: str) -> bool:
+    """
+    Returns whether any of the literal characters occurs in the text.
+    
+    Non-ASCII text always passes, since \\d in the str patterns also matches
+    non-ASCII digits that a check for '0'-'9' would miss.
+    """
+    return not text.isascii() or any(char in text for char in literals)
+
+
+def _combine_patterns(**patterns: re.Pattern) -> re.Pattern:
+    """
+    Compiles several patterns into one alternation of named groups.
+    
+    The combined pattern scans the text once instead of once per pattern;
+    the name of the matching group identifies the PII type. Case-insensitive
+    patterns keep their flag as a scoped (?i:...) group.
+    """
+    return re.compile(
+        "|".join(f"(?P<{name}>{_scoped(pattern)})" for name, pattern in patterns.items())
+    )
+
+
+def _scoped(pattern: re.Pattern) -> str:
+    """
+    Returns the pattern source, wrapped in (?i:...) if it ignores case.
+    """
+    if pattern.flags & re.IGNORECASE:
+        return f"(?i:{pattern.pattern})"
+    return pattern.pattern
+
+
+# Scanners used by redact_transcript, compiled once at import. Contact PII is
+# scanned first and aggressive mode runs dates and names over its output, as
+# sequential redaction did: a leftmost date can't eat into the SSN after it.
+# Email leads its alternation so an address with a numeric local part
+# (555-123-4567@x.com) is redacted whole rather than as a phone number. These
+# stay on the stdlib engine for non-ASCII text, where its Unicode \d also
+# catches digits RE2 treats as ASCII only.
+_SCANNER_PATTERNS = {
+    'pii': {'email': EMAIL_PATTERN, 'phone': PHONE_PATTERN, 'ssn': SSN_PATTERN},
+    'aggressive': {'date': DATE_PATTERN, 'name': _NAME_RE},
+}
+_SCANNER_PASSES = {False: ('pii',), True: ('pii', 'aggressive')}
+_SCANNERS = {scan: _combine_patterns(**patterns) for scan, patterns in _SCANNER_PATTERNS.items()}
+_SCANNER_LITERALS = _DIGITS + '@'
+
+# Bytes versions of the scanners for ASCII transcripts (the common case):
+# matching UTF-8 bytes skips the engine's Unicode handling, and for ASCII input
+# \b, \d and case folding behave the same as in the str patterns. RE2 reports
+# group names of bytes patterns as bytes, so labels are keyed both ways.
+_ASCII_SCANNERS = {
+    scan: regex_engine.compile(scanner.pattern.encode()) for scan, scanner in _SCANNERS.items()
+}
+_ASCII_LABELS = {
+    key: label.encode()
+    for name, label in PII_LABELS.items()
+    for key in (name, name.encode())
+}
+
+# Per-type patterns behind the redact_* helpers, with their ASCII counterparts
+_PATTERNS = {'phone': PHONE_PATTERN, 'ssn': SSN_PATTERN, 'email': EMAIL_PATTERN}
+_ASCII_PATTERNS = {
+    kind: regex_engine.compile(pattern.pattern.encode()) for kind, pattern in _PATTERNS.items()
+}
+
+
+def _redact(text: str, kind: str) -> str:
+    """
+    Replaces every match of one PII type with its placeholder.
+    
+    ASCII text is matched as bytes on the linear-time engine, other text on
+    the stdlib pattern.
+    """
+    if not _may_contain(text, _LITERALS[kind]):
+        return text
+    if text.isascii():
+        return _ASCII_PATTERNS[kind].sub(_ASCII_LABELS[kind], text.encode()).decode()
+    return _PATTERNS[kind].sub(PII_LABELS[kind], text)
+
+
+def _build_hyperscan_database(patterns: dict):
+    """
+    Compiles patterns into a Hyperscan block-mode database.
+    
+    Expression ids follow the alternation order of the combined scanner and
+    every match reports its leftmost start.
+    """
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.pattern.encode() for pattern in patterns.values()],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[
+            hyperscan.HS_FLAG_SOM_LEFTMOST
+            | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0)
+            for pattern in patterns.values()
+        ],
+    )
+    return database
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_databases() -> dict:
+    """
+    Compiles the Hyperscan database of every scan on first use.
+    
+    Only processes that call redact_batch pay for the compilation.
+    """
+    return {scan: _build_hyperscan_database(patterns) for scan, patterns in _SCANNER_PATTERNS.items()}
+
+
+# Placeholder for each Hyperscan expression id, per scan
+_HYPERSCAN_LABELS = {
+    scan: [PII_LABELS[name].encode() for name in patterns]
+    for scan, patterns in _SCANNER_PATTERNS.items()
 }
 
 
@@ -40,7 +217,7 @@ def redact_phone_numbers(text: str) -> str:
         >>> redact_phone_numbers("Call me at 555-123-4567")
         'Call me at [PHONE]'
     """
-    return PHONE_PATTERN.sub('[PHONE]', text)
+    return _redact(text, 'phone')
 
 
 def redact_ssn(text: str) -> str:
@@ -53,7 +230,7 @@ def redact_ssn(text: str) -> str:
     Returns:
         Text with SSNs replaced by [SSN]
     """
-    return SSN_PATTERN.sub('[SSN]', text)
+    return _redact(text, 'ssn')
 
 
 def redact_email(text: str) -> str:
@@ -66,7 +243,7 @@ def redact_email(text: str) -> str:
     Returns:
         Text with emails replaced by [EMAIL]
     """
-    return EMAIL_PATTERN.sub('[EMAIL]', text)
+    return _redact(text, 'email')
 
 
 def redact_names(text: str) -> str:
@@ -83,17 +260,21 @@ def redact_names(text: str) -> str:
         This is a simple implementation using a small name list.
         Production systems should use NER (Named Entity Recognition).
     """
-    words = text.split()
-    redacted_words = []
-    
-    for word in words:
-        clean_word = word.strip('.,!?;:').lower()
-        if clean_word in COMMON_NAMES:
-            redacted_words.append('[NAME]')
-        else:
-            redacted_words.append(word)
-    
-    return ' '.join(redacted_words)
+    return _NAME_RE.sub(PII_LABELS['name'], text)
+
+
+def _pii_label(match: re.Match) -> str:
+    """
+    Returns the placeholder for a match of a combined PII scanner.
+    """
+    return PII_LABELS[match.lastgroup]
+
+
+def _ascii_pii_label(match: re.Match) -> bytes:
+    """
+    Returns the placeholder for a match of an ASCII (bytes) scanner.
+    """
+    return _ASCII_LABELS[match.lastgroup]
 
 
 def redact_transcript(text: str, aggressive: bool = False) -> str:
@@ -111,17 +292,97 @@ def redact_transcript(text: str, aggressive: bool = False) -> str:
         >>> redact_transcript("Hi, I'm John. My number is 555-1234.", aggressive=True)
         "Hi, I'm [NAME]. My number is [PHONE]."
     """
-    result = text
+    if not text:
+        return text
+    
+    scans = _SCANNER_PASSES[aggressive]
+    # Names need no digit or '@', so only the contact PII scan can be skipped
+    if not _may_contain(text, _SCANNER_LITERALS):
+        scans = scans[1:]
+        if not scans:
+            return text
+    
+    if text.isascii():
+        data = text.encode()
+        for scan in scans:
+            data = _ASCII_SCANNERS[scan].sub(_ascii_pii_label, data)
+        return data.decode()
+    
+    for scan in scans:
+        text = _SCANNERS[scan].sub(_pii_label, text)
+    return text
+
+
+def redact_batch(texts: Iterable[str], aggressive: bool = False) -> List[str]:
+    """
+    Apply all redaction rules to many transcripts.
+    
+    With Hyperscan installed, ASCII transcripts are scanned against one
+    multi-pattern database per scan (compiled on the first call) and the matches are resolved the way the
+    combined scanners pick them. Other transcripts, and the rare ones with
+    partially overlapping matches, go through redact_transcript.
+    
+    Args:
+        texts: Input transcript texts
+        aggressive: If True, also redacts names and dates
+        
+    Returns:
+        Redacted transcripts, in input order
+    """
+    if hyperscan is None:
+        return [redact_transcript(text, aggressive) for text in texts]
     
-    result = redact_phone_numbers(result)
-    result = redact_ssn(result)
-    result = redact_email(result)
+    databases = _hyperscan_databases()
+    scans = _SCANNER_PASSES[aggressive]
+    # Scratch space is per call so concurrent batches never share one
+    scratches = {scan: hyperscan.Scratch(databases[scan]) for scan in scans}
+    redacted = []
+    for text in texts:
+        result = text.encode() if text and text.isascii() else None
+        for scan in scans:
+            if result is None:
+                break
+            result = _hyperscan_redact(scan, databases[scan], result, scratches[scan])
+        redacted.append(result.decode() if result is not None else redact_transcript(text, aggressive))
+    return redacted
+
+
+def _hyperscan_redact(scan: str, database, data: bytes, scratch) -> Optional[bytes]:
+    """
+    Replaces the Hyperscan matches in data with their placeholders.
     
-    if aggressive:
-        result = redact_names(result)
-        result = DATE_PATTERN.sub('[DATE]', result)
+    Hits are taken leftmost first, then by alternation order, then longest,
+    skipping hits inside an already replaced span. Returns None when a hit
+    overlaps a replaced span only partially, as the regex engine's choice
+    can't be reconstructed from the hits then.
+    """
+    hits = []
+    database.scan(data, match_event_handler=_collect_hit, context=hits, scratch=scratch)
+    if not hits:
+        return data
     
-    return result
+    hits.sort()
+    labels = _HYPERSCAN_LABELS[scan]
+    pieces = []
+    position = 0
+    for start, expression_id, negative_end in hits:
+        end = -negative_end
+        if start < position:
+            if end > position:
+                return None
+            continue
+        pieces.append(data[position:start])
+        pieces.append(labels[expression_id])
+        position = end
+    pieces.append(data[position:])
+    return b''.join(pieces)
+
+
+def _collect_hit(expression_id: int, start: int, end: int, flags: int, hits: list):
+    """
+    Hyperscan match callback, stores hits so they sort leftmost-first.
+    """
+    hits.append((start, expression_id, -end))
 
 
 def get_redacted_entities(text: str) -> List[Tuple[str, str]]:
@@ -138,15 +399,8 @@ def get_redacted_entities(text: str) -> List[Tuple[str, str]]:
         >>> get_redacted_entities("Call 555-1234 or email me@example.com")
         [('phone', '555-1234'), ('email', 'me@example.com')]
     """
-    entities = []
-    
-    for match in PHONE_PATTERN.finditer(text):
-        entities.append(('phone', match.group()))
-    
-    for match in EMAIL_PATTERN.finditer(text):
-        entities.append(('email', match.group()))
-    
-    for match in SSN_PATTERN.finditer(text):
-        entities.append(('ssn', match.group()))
+    if not _may_contain(text, _SCANNER_LITERALS):
+        return []
     
-    return entities
+    # One pass over the contact PII scanner, entities come back in text order
+    return [(match.lastgroup, match.group()) for match in _SCANNERS['pii'].finditer(text)]
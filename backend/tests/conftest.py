@@ -3,20 +3,76 @@ Pytest configuration and fixtures for backend tests.
 """
 import pytest
 from fastapi.testclient import TestClient
+from app.core.config import settings
 from app.main import app
+from app.providers.base import STTProvider, TTSProvider, TranscriptionResult
+from app.providers.registry import ProviderRegistry
+from app.providers.tts_piper import wav_header
 
 
-@pytest.fixture
+class StubSTTProvider(STTProvider):
+    """STT provider returning a fixed transcript, so no Whisper model is loaded."""
+    
+    async def transcribe(self, audio, language=None):
+        return TranscriptionResult(text="hello front desk", confidence=0.9, language=language or "en", duration_ms=0)
+    
+    async def health_check(self):
+        return True
+
+
+class StubTTSProvider(TTSProvider):
+    """TTS provider returning a short silent WAV, so no Piper voice is loaded."""
+    
+    async def synthesize(self, text, voice=None, speed=1.0):
+        return wav_header(16000, 3200) + bytes(3200)
+    
+    async def health_check(self):
+        return True
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+    """Create a test client for the FastAPI application, shared by all tests."""
+    # Startup and shutdown run once per session. The model-backed providers are
+    # stubbed before startup, so the session never loads or downloads models
+    providers = ProviderRegistry(settings, stt=StubSTTProvider(), tts=StubTTSProvider())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "warm_on_startup", False)
+        mp.setattr(app.state, "providers", providers)
+        with TestClient(app) as test_client:
+            yield test_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def warm_redaction():
+    """Run every redaction path once so no test pays first-use engine setup."""
+    from app.utils import redaction
+    
+    sample = "warmup John 555-000-0000 a@b.co 000-00-0000 1/2/2024"
+    for text in (sample, sample + " é"):
+        redaction.redact_phone_numbers(text)
+        redaction.redact_email(text)
+        redaction.redact_ssn(text)
+        redaction.redact_names(text)
+        redaction.redact_transcript(text)
+        redaction.redact_transcript(text, aggressive=True)
+        redaction.redact_batch([text])
+        redaction.redact_batch([text], aggressive=True)
+        redaction.get_redacted_entities(text)
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    """Start every test with an empty readiness cache, since the app is shared."""
+    from app.api import routes
+    monkeypatch.setattr(routes, "_ready_cache", None)
+
+
+@pytest.fixture(scope="session")
 def sample_audio_data():
     """Provide sample audio data in bytes (simulated WAV file with tone)."""
-    import struct
-    import math
+    import numpy as np
+    from app.providers.tts_piper import wav_header
     
     # WAV parameters
     sample_rate = 16000
@@ -24,41 +80,19 @@ def sample_audio_data():
     frequency = 440  # 440 Hz tone (A note)
     num_samples = int(sample_rate * duration)
     
-    # Generate a simple sine wave tone (simulates speech-like audio)
-    samples = []
-    for i in range(num_samples):
-        # Sine wave with amplitude variation to simulate speech
-        value = int(16000 * math.sin(2 * math.pi * frequency * i / sample_rate))
-        # Add some amplitude modulation
-        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 2 * i / sample_rate)
-        value = int(value * envelope)
-        samples.append(value)
+    # Generate a simple sine wave tone (simulates speech-like audio), built
+    # once per session since the bytes are immutable. Vectorized numpy takes
+    # about half a millisecond here, far less than a JIT would need to compile.
+    t = np.arange(num_samples)
+    wave = np.trunc(16000 * np.sin(2 * np.pi * frequency * t / sample_rate))
+    # Add some amplitude modulation
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 2 * t / sample_rate)
     
     # Pack samples as 16-bit PCM
-    audio_samples = b''.join(struct.pack('<h', s) for s in samples)
-    
-    # Calculate sizes
-    data_size = len(audio_samples)
-    chunk_size = 36 + data_size
+    audio_samples = (wave * envelope).astype('<i2').tobytes()
     
     # WAV header (mono, 16kHz, 16-bit PCM)
-    wav_header = struct.pack('<4sI4s4sIHHIIHH4sI',
-        b'RIFF',
-        chunk_size,
-        b'WAVE',
-        b'fmt ',
-        16,          # Subchunk1Size (16 for PCM)
-        1,           # AudioFormat (1 for PCM)
-        1,           # NumChannels (1 = mono)
-        sample_rate, # SampleRate
-        sample_rate * 2,  # ByteRate
-        2,           # BlockAlign
-        16,          # BitsPerSample
-        b'data',
-        data_size
-    )
-    
-    return wav_header + audio_samples
+    return wav_header(sample_rate, len(audio_samples)) + audio_samples
 
 
 @pytest.fixture
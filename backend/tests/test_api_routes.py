@@ -1,8 +1,10 @@
 """
 Test API routes and endpoints.
 """
+import asyncio
 import pytest
 from io import BytesIO
+from types import SimpleNamespace
 
 
 class TestHealthEndpoint:
@@ -24,6 +26,82 @@ class TestHealthEndpoint:
         assert "status" in data
         assert "timestamp" in data
         assert "providers" in data
+    
+    def test_health_check_timestamp_format(self, client):
+        """Test health timestamp is a second-precision UTC ISO string."""
+        data = client.get("/api/healthz").json()
+        assert data["timestamp"].endswith("Z")
+        assert "." not in data["timestamp"]
+    
+    def test_timestamp_is_formatted_once_per_second(self, monkeypatch):
+        """Test calls within a second reuse the cached string and a new second refreshes it."""
+        import time
+        from app.api import routes
+        now = [1700000000.1]
+        formatted = []
+        strftime = time.strftime
+        monkeypatch.setattr(routes, "_timestamp_cache", (0, ""))
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        monkeypatch.setattr(time, "strftime", lambda *args: formatted.append(args) or strftime(*args))
+        
+        first = routes.utc_timestamp()
+        now[0] = 1700000000.9
+        assert routes.utc_timestamp() == first == "2023-11-14T22:13:20Z"
+        assert len(formatted) == 1
+        
+        now[0] = 1700000001.0
+        assert routes.utc_timestamp() == "2023-11-14T22:13:21Z"
+        assert len(formatted) == 2
+
+
+class FakeProvider:
+    """Provider stub with a configurable health check."""
+    
+    def __init__(self, healthy=True, delay=0.0):
+        self.healthy = healthy
+        self.delay = delay
+        self.calls = 0
+    
+    async def health_check(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.healthy
+
+
+class TestReadinessEndpoint:
+    """Test the readiness check endpoint."""
+    
+    @pytest.fixture
+    def fake_providers(self, client, monkeypatch):
+        """Swap the shared providers for stubs and clear the readiness cache."""
+        from app.api import routes
+        providers = SimpleNamespace(stt=FakeProvider(), tts=FakeProvider(), intent=FakeProvider())
+        monkeypatch.setattr(client.app.state, "providers", providers)
+        monkeypatch.setattr(routes, "_ready_cache", None)
+        return providers
+    
+    def test_readiness_all_healthy(self, client, fake_providers):
+        """Test readiness reports ready when every provider is healthy."""
+        response = client.get("/api/readyz")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["providers"] == {"stt": True, "tts": True, "intent": True}
+    
+    def test_readiness_result_is_cached(self, client, fake_providers):
+        """Test providers are not probed again within the cache TTL."""
+        client.get("/api/readyz")
+        client.get("/api/readyz")
+        assert fake_providers.stt.calls == 1
+    
+    def test_readiness_hung_provider_is_degraded(self, client, fake_providers, monkeypatch):
+        """Test a provider exceeding the health check timeout counts as unhealthy."""
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "health_check_timeout_ms", 10)
+        fake_providers.tts.delay = 1.0
+        data = client.get("/api/readyz").json()
+        assert data["status"] == "degraded"
+        assert data["providers"]["tts"] is False
 
 
 class TestSTTEndpoint:
@@ -57,6 +135,16 @@ class TestSTTEndpoint:
         if "text_redacted" in result:
             assert isinstance(result["text_redacted"], str)
     
+    def test_transcribe_uses_stubbed_provider(self, client):
+        """Test the session client transcribes through the stub, not a loaded model."""
+        from app.providers.stt_whisper import FasterWhisperProvider
+        files = {"file": ("test.wav", BytesIO(b"RIFF"), "audio/wav")}
+        response = client.post("/api/stt/transcribe", files=files)
+        
+        assert response.status_code == 200
+        assert response.json()["text"] == "hello front desk"
+        assert not isinstance(client.app.state.providers.stt, FasterWhisperProvider)
+    
     def test_transcribe_missing_audio_file(self, client):
         """Test transcription fails without audio file (negative case)."""
         response = client.post("/api/stt/transcribe", files={})
@@ -84,6 +172,57 @@ class TestSTTEndpoint:
         response = client.post("/api/stt/transcribe", files=files)
         # Should handle or reject appropriately
         assert response.status_code in [200, 400, 413, 422, 500]
+    
+    def test_transcribe_rejects_when_saturated(self, client, monkeypatch):
+        """Test transcription is rejected with 429 when the STT queue is full."""
+        from app.api import routes
+        monkeypatch.setattr(routes, "_stt_limiter", SimpleNamespace(saturated=True))
+        files = {"file": ("test.wav", BytesIO(b"RIFF"), "audio/wav")}
+        response = client.post("/api/stt/transcribe", files=files)
+        assert response.status_code == 429
+    
+    def test_transcribe_rejects_oversize_upload(self, client, monkeypatch):
+        """Test uploads above the configured limit are rejected (negative case)."""
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "max_upload_bytes", 1024)
+        files = {"file": ("big.wav", BytesIO(b"\x00" * 4096), "audio/wav")}
+        response = client.post("/api/stt/transcribe", files=files)
+        assert response.status_code == 413
+    
+    def test_oversize_content_length_is_rejected_before_body_is_read(self, client, monkeypatch):
+        """Test a declared oversize body gets 413 without reaching the route (negative case)."""
+        from app.core.config import settings
+        from app.api import routes
+        monkeypatch.setattr(settings, "max_upload_bytes", 1024)
+        monkeypatch.setattr(routes, "upload_size", lambda file: pytest.fail("body was spooled"))
+        files = {"file": ("big.wav", BytesIO(b"\x00" * 4096), "audio/wav")}
+        response = client.post("/api/stt/transcribe", files=files)
+        assert response.status_code == 413
+    
+    def test_malformed_content_length_is_rejected(self, client):
+        """Test a non-numeric Content-Length gets 400 rather than 500 (negative case)."""
+        response = client.post(
+            "/api/stt/transcribe",
+            content=b"RIFF",
+            headers={"Content-Length": "abc", "Content-Type": "audio/wav"}
+        )
+        assert response.status_code == 400
+    
+    def test_transcribe_rejects_oversize_chunked_upload(self, client, monkeypatch):
+        """Test uploads without Content-Length are checked after spooling (negative case)."""
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "max_upload_bytes", 1024)
+        body = (
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="big.wav"\r\n'
+            b"Content-Type: audio/wav\r\n\r\n" + b"\x00" * 4096 + b"\r\n--boundary--\r\n"
+        )
+        response = client.post(
+            "/api/stt/transcribe",
+            content=iter([body]),
+            headers={"Content-Type": "multipart/form-data; boundary=boundary"}
+        )
+        assert response.status_code == 413
 
 
 class TestIntentEndpoint:
@@ -207,6 +346,16 @@ class TestTTSEndpoint:
         assert response.headers["content-type"] in ["audio/wav", "audio/x-wav"]
         assert len(response.content) > 0
     
+    def test_tts_speak_without_streaming(self, client):
+        """Test the buffered path returns the same audio as the streamed one."""
+        streamed = client.post("/api/tts/speak", json={"text": "Hello"})
+        buffered = client.post("/api/tts/speak", params={"stream": False}, json={"text": "Hello"})
+        
+        assert buffered.status_code == 200
+        assert buffered.headers["content-type"] in ["audio/wav", "audio/x-wav"]
+        assert buffered.content[:4] == b"RIFF"
+        assert buffered.content == streamed.content
+    
     def test_tts_speak_with_speed(self, client):
         """Test TTS with custom speed parameter."""
         response = client.post(
@@ -297,6 +446,26 @@ class TestCORSHeaders:
         assert response.status_code == 200
 
 
+class TestCompression:
+    """Test response compression."""
+    
+    def test_large_json_is_gzipped(self, client):
+        """Test JSON responses above the size threshold are compressed."""
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+    
+    def test_tts_audio_is_not_gzipped(self, client):
+        """Test WAV audio from the TTS endpoint is sent uncompressed."""
+        response = client.post(
+            "/api/tts/speak",
+            json={"text": "Hello"},
+            headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "identity"
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
     
@@ -316,3 +485,30 @@ class TestErrorHandling:
         response = client.post("/api/intent/route", json=large_json)
         # Should handle or reject appropriately
         assert response.status_code in [200, 413, 422]
+
+
+class TestProviderRegistry:
+    """Test shared provider instances."""
+    
+    def test_providers_are_reused(self, client):
+        """Test that the same provider instances serve every request."""
+        providers = client.app.state.providers
+        assert providers.tts is providers.tts
+        assert providers.intent is providers.intent
+
+
+class TestRequestContext:
+    """Test per-request bookkeeping."""
+    
+    @pytest.mark.asyncio
+    async def test_binds_request_id_and_freezes_duration(self):
+        """Test the request ID is set in the logging context and duration is stable."""
+        from app.api.routes import RequestContext
+        from app.telemetry.logging_config import request_id_ctx
+        
+        async with RequestContext("Test") as ctx:
+            assert ctx.request_id.startswith("req_")
+            assert request_id_ctx.get() is ctx.request_id
+            duration_ms = ctx.duration_ms
+            await asyncio.sleep(0.01)
+            assert ctx.duration_ms == duration_ms
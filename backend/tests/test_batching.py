@@ -0,0 +1,140 @@
+"""
+Test STT micro-batching scheduler.
+"""
+import asyncio
+import pytest
+from io import BytesIO
+from app.providers.base import STTProvider, TranscriptionResult, ProviderException
+from app.providers.batching import BatchScheduler, length_bucket
+
+
+class FakeSTTProvider(STTProvider):
+    """STT provider echoing the audio payload and recording batch sizes."""
+
+    supports_batching = True
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.batch_sizes = []
+
+    async def transcribe(self, audio, language=None):
+        text = audio.read().decode()
+        if text == "corrupt":
+            raise ProviderException("corrupt audio")
+        return TranscriptionResult(text=text, confidence=1.0, duration_ms=0)
+
+    async def transcribe_batch(self, audios, language=None):
+        self.batch_sizes.append(len(audios))
+        await asyncio.sleep(self.delay)
+        return await super().transcribe_batch(audios, language)
+
+    async def health_check(self):
+        return True
+
+
+class TestBatchScheduler:
+    """Test request accumulation and dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        """Test requests within the window are transcribed together."""
+        provider = FakeSTTProvider()
+        scheduler = BatchScheduler(provider, max_batch_size=8, max_wait_ms=50)
+        scheduler.start()
+        try:
+            results = await asyncio.gather(*(
+                scheduler.submit(BytesIO(f"clip {i}".encode())) for i in range(4)
+            ))
+        finally:
+            await scheduler.stop()
+
+        assert [r.text for r in results] == [f"clip {i}" for i in range(4)]
+        assert provider.batch_sizes == [4]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_capped(self):
+        """Test batches never exceed max_batch_size."""
+        provider = FakeSTTProvider()
+        scheduler = BatchScheduler(provider, max_batch_size=2, max_wait_ms=50)
+        scheduler.start()
+        try:
+            await asyncio.gather(*(scheduler.submit(BytesIO(b"x")) for _ in range(5)))
+        finally:
+            await scheduler.stop()
+
+        assert max(provider.batch_sizes) <= 2
+        assert sum(provider.batch_sizes) == 5
+
+    @pytest.mark.asyncio
+    async def test_provider_error_is_isolated(self):
+        """Test a failing upload fails only its own request (negative case)."""
+        provider = FakeSTTProvider()
+        scheduler = BatchScheduler(provider, max_wait_ms=50)
+        scheduler.start()
+        try:
+            results = await asyncio.gather(
+                scheduler.submit(BytesIO(b"clip 0")),
+                scheduler.submit(BytesIO(b"corrupt")),
+                scheduler.submit(BytesIO(b"clip 2")),
+                return_exceptions=True
+            )
+        finally:
+            await scheduler.stop()
+
+        assert provider.batch_sizes == [3]
+        assert results[0].text == "clip 0"
+        assert isinstance(results[1], ProviderException)
+        assert results[2].text == "clip 2"
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_in_flight_batches(self):
+        """Test stopping cancels batches already handed to the provider (edge case)."""
+        scheduler = BatchScheduler(FakeSTTProvider(delay=10), max_wait_ms=1)
+        scheduler.start()
+        request = asyncio.create_task(scheduler.submit(BytesIO(b"x")))
+        while not scheduler._dispatching:
+            await asyncio.sleep(0.001)
+
+        await scheduler.stop()
+
+        assert not scheduler._dispatching
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+    @pytest.mark.asyncio
+    async def test_submit_without_loop_transcribes_directly(self):
+        """Test submit falls back to a direct call when not started."""
+        provider = FakeSTTProvider()
+        result = await BatchScheduler(provider).submit(BytesIO(b"hello"))
+        assert result.text == "hello"
+        assert provider.batch_sizes == []
+
+    def test_length_buckets(self):
+        """Test audio is bucketed by estimated duration."""
+        assert length_bucket(BytesIO(b"\x00" * 32000 * 5)) == 0
+        assert length_bucket(BytesIO(b"\x00" * 32000 * 20)) == 1
+        assert length_bucket(BytesIO(b"\x00" * 32000 * 40)) == 2
+
+
+class TestRegistryBatching:
+    """Test when the registry puts the scheduler in front of the provider."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled, supports_batching, running", [
+        (False, True, False),
+        (True, False, False),
+        (True, True, True),
+    ])
+    async def test_batching_needs_flag_and_capable_provider(self, enabled, supports_batching, running):
+        """Test batching starts only when enabled and the provider really batches."""
+        from app.core.config import Settings
+        from app.providers.registry import ProviderRegistry
+        provider = FakeSTTProvider()
+        provider.supports_batching = supports_batching
+        providers = ProviderRegistry(Settings(stt_batching_enabled=enabled), stt=provider)
+
+        providers.start_batching()
+        try:
+            assert providers.stt_batcher.is_running is running
+        finally:
+            await providers.stop_batching()
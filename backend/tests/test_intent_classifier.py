@@ -2,76 +2,93 @@
 Test intent classification logic.
 """
 import pytest
+from collections.abc import Mapping
 from app.nlu.intent_router import RuleBasedIntentRouter
 
 
-@pytest.fixture
-def router():
-    """Create intent router instance for testing."""
+@pytest.fixture(scope="module")
+def shared_router():
+    """Create one intent router instance for the module."""
     return RuleBasedIntentRouter()
 
 
+@pytest.fixture
+def router(shared_router):
+    """Provide the shared router with an empty result cache."""
+    shared_router.clear_cache()
+    return shared_router
+
+
+# Utterances per intent, one test case each
+APPOINTMENT_CASES = [
+    "I need to schedule an appointment",
+    "Can I book a doctor's visit for next week",
+    "I want to make an appointment",
+    "Schedule me for Tuesday at 2pm",
+    "Book an appointment please"
+]
+
+FINANCIAL_CASES = [
+    "What is my copay",
+    "Do you accept my insurance",
+    "How much will this cost",
+    "What are the payment options",
+    "Check my insurance coverage"
+]
+
+GENERAL_INQUIRY_CASES = [
+    "What are your office hours",
+    "Where is your location",
+    "Do you have parking",
+    "What services do you offer"
+]
+
+UNKNOWN_CASES = [
+    "The weather is nice today",
+    "I like pizza",
+    "Random unrelated text"
+]
+
+CONFIDENCE_CASES = [
+    "Schedule an appointment",
+    "What's my copay",
+    "Office hours",
+    "Random text"
+]
+
+
 class TestIntentClassification:
     """Test intent classification functionality."""
     
     @pytest.mark.asyncio
-    async def test_appointment_scheduling_intent(self, router):
+    @pytest.mark.parametrize("text", APPOINTMENT_CASES)
+    async def test_appointment_scheduling_intent(self, router, text):
         """Test classification of appointment scheduling requests."""
-        test_cases = [
-            "I need to schedule an appointment",
-            "Can I book a doctor's visit for next week",
-            "I want to make an appointment",
-            "Schedule me for Tuesday at 2pm",
-            "Book an appointment please"
-        ]
-        
-        for text in test_cases:
-            result = await router.route(text)
-            assert result.intent == "APPOINTMENT_SCHEDULING"
-            assert result.confidence > 0.3  # Lowered threshold
+        result = await router.route(text)
+        assert result.intent == "APPOINTMENT_SCHEDULING"
+        assert result.confidence > 0.3  # Lowered threshold
     
     @pytest.mark.asyncio
-    async def test_financial_clearance_intent(self, router):
+    @pytest.mark.parametrize("text", FINANCIAL_CASES)
+    async def test_financial_clearance_intent(self, router, text):
         """Test classification of financial queries."""
-        test_cases = [
-            "What is my copay",
-            "Do you accept my insurance",
-            "How much will this cost",
-            "What are the payment options",
-            "Check my insurance coverage"
-        ]
-        
-        for text in test_cases:
-            result = await router.route(text)
-            assert result.intent in ["FINANCIAL_CLEARANCE", "GENERAL_INQUIRY"]
+        result = await router.route(text)
+        assert result.intent in ["FINANCIAL_CLEARANCE", "GENERAL_INQUIRY"]
     
     @pytest.mark.asyncio
-    async def test_general_inquiry_intent(self, router):
+    @pytest.mark.parametrize("text", GENERAL_INQUIRY_CASES)
+    async def test_general_inquiry_intent(self, router, text):
         """Test classification of general inquiries."""
-        test_cases = [
-            "What are your office hours",
-            "Where is your location",
-            "Do you have parking",
-            "What services do you offer"
-        ]
-        
-        for text in test_cases:
-            result = await router.route(text)
-            assert result.intent in ["GENERAL_INQUIRY", "UNKNOWN"]
+        result = await router.route(text)
+        assert result.intent in ["GENERAL_INQUIRY", "UNKNOWN"]
     
     @pytest.mark.asyncio
-    async def test_unknown_intent(self, router):
+    @pytest.mark.parametrize("text", UNKNOWN_CASES)
+    async def test_unknown_intent(self, router, text):
         """Test classification of unrelated text."""
-        test_cases = [
-            "The weather is nice today",
-            "I like pizza",
-            "Random unrelated text"
-        ]
-        
-        for text in test_cases:
-            result = await router.route(text)
-            assert result.intent == "UNKNOWN"
-            assert result.confidence >= 0.0
+        result = await router.route(text)
+        assert result.intent == "UNKNOWN"
+        assert result.confidence >= 0.0
     
     @pytest.mark.asyncio
     async def test_empty_string_intent(self, router):
@@ -80,18 +97,11 @@ class TestIntentClassification:
         assert result.intent == "UNKNOWN"
     
     @pytest.mark.asyncio
-    async def test_confidence_scores(self, router):
+    @pytest.mark.parametrize("text", CONFIDENCE_CASES)
+    async def test_confidence_scores(self, router, text):
         """Test that confidence scores are within valid range."""
-        test_cases = [
-            "Schedule an appointment",
-            "What's my copay",
-            "Office hours",
-            "Random text"
-        ]
-        
-        for text in test_cases:
-            result = await router.route(text)
-            assert 0.0 <= result.confidence <= 1.0
+        result = await router.route(text)
+        assert 0.0 <= result.confidence <= 1.0
     
     @pytest.mark.asyncio
     async def test_entity_extraction(self, router):
@@ -100,7 +110,39 @@ class TestIntentClassification:
         result = await router.route(text)
         
         assert hasattr(result, 'entities')
-        assert isinstance(result.entities, dict)
+        assert isinstance(result.entities, Mapping)
+    
+    @pytest.mark.asyncio
+    async def test_entity_keywords_follow_priority(self, router):
+        """Test the highest-priority keyword of each category decides the entity value."""
+        texts = [
+            "Does medicaid or medicare cover my bill and copay",
+            "What is the deductible on my private insurance payment",
+            "Where is your address, what are your hours",
+            "I need a consultation, or maybe a check-up appointment",
+        ]
+        entities = [(await router.route(text)).entities for text in texts]
+        
+        assert entities[0] == {'insurance_type': 'medicare', 'query_type': 'copay'}
+        assert entities[1] == {'insurance_type': 'private', 'query_type': 'deductible'}
+        assert entities[2] == {'inquiry_type': 'hours'}
+        assert entities[3] == {'appointment_type': 'checkup'}
+    
+    @pytest.mark.asyncio
+    async def test_entity_keywords_follow_token_rules(self, router):
+        """Test entity keywords match inflected forms but not longer words (edge case)."""
+        result = await router.route("Are my bills covered by insurance")
+        assert result.entities.get('query_type') == 'billing'
+        
+        result = await router.route("Is my insurance worth a billion")
+        assert 'query_type' not in result.entities
+    
+    @pytest.mark.asyncio
+    async def test_time_and_date_extraction(self, router):
+        """Test time and date entities are extracted for appointments."""
+        result = await router.route("Book an appointment on Friday at 10:30 am")
+        assert result.entities.get('date') == 'friday'
+        assert result.entities.get('time') == '10:30 am'
     
     @pytest.mark.asyncio
     async def test_case_insensitive_classification(self, router):
@@ -156,6 +198,57 @@ class TestIntentClassification:
         result = await router.route(text)
         assert result.intent == "UNKNOWN"
 
+    
+    @pytest.mark.asyncio
+    async def test_keywords_match_whole_words(self, router):
+        """Test keywords only match whole words, multi-word phrases as substrings."""
+        result = await router.route("The hospital made a billion")
+        assert result.intent == "UNKNOWN"
+        
+        result = await router.route("I'd like to see the doctor")
+        assert result.intent == "APPOINTMENT_SCHEDULING"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text, intent", [
+        ("Can I move my appointments?", "APPOINTMENT_SCHEDULING"),
+        ("Are payments due?", "FINANCIAL_CLEARANCE"),
+        ("I want to reschedule", "APPOINTMENT_SCHEDULING"),
+    ])
+    async def test_inflected_keywords_match(self, router, text, intent):
+        """Test plural and inflected keyword forms still score (edge case)."""
+        result = await router.route(text)
+        assert result.intent == intent
+    
+    @pytest.mark.asyncio
+    async def test_results_are_cached_per_lowercased_text(self, router):
+        """Test repeated utterances are served from the cache."""
+        first = await router.route("I need an appointment")
+        assert await router.route("I NEED AN APPOINTMENT") is first
+        
+        router.clear_cache()
+        assert await router.route("I need an appointment") is not first
+
+    
+    @pytest.mark.asyncio
+    async def test_results_are_immutable(self, router):
+        """Test shared (cached) results can't be modified by a caller."""
+        import dataclasses
+        result = await router.route("I need an appointment")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.intent = "UNKNOWN"
+        with pytest.raises(TypeError):
+            result.entities["date"] = "never"
+        
+        unknown = await router.route("xyzzy")
+        with pytest.raises(TypeError):
+            unknown.entities["date"] = "never"
+    
+    def test_keyword_sets_are_frozen(self):
+        """Test module-level keyword sets can't be mutated at runtime."""
+        from app.nlu import intent_router
+        for keywords in intent_router.INTENT_KEYWORDS.values():
+            assert isinstance(keywords, frozenset)
+
 
 class TestIntentResponseGeneration:
     """Test response generation for different intents."""
@@ -186,3 +279,23 @@ class TestIntentResponseGeneration:
         
         assert hasattr(result, 'intent')
         assert result.intent == "UNKNOWN"
+    
+    def test_response_templates(self):
+        """Test replies are filled in from the extracted entities."""
+        from app.nlu.intent_router import generate_response
+        from app.providers.base import IntentResult
+        
+        def reply(intent, **entities):
+            return generate_response(IntentResult(
+                intent=intent, confidence=1.0, entities=entities, handoff_recommended=False
+            ))
+        
+        assert reply("APPOINTMENT_SCHEDULING", date="friday", time="10:30 am").startswith(
+            "I can help you schedule an appointment for friday at 10:30 am."
+        )
+        assert "for friday. What time" in reply("APPOINTMENT_SCHEDULING", date="friday")
+        assert "What day and time" in reply("APPOINTMENT_SCHEDULING", time="10:30 am")
+        assert "your medicare coverage" in reply("FINANCIAL_CLEARANCE", insurance_type="medicare", query_type="billing")
+        assert "copay" in reply("FINANCIAL_CLEARANCE", insurance_type="medicare", query_type="copay")
+        assert reply("GENERAL_INQUIRY", inquiry_type="unknown") == reply("GENERAL_INQUIRY")
+        assert reply("UNKNOWN").startswith("I'm here to help. Could you please clarify")
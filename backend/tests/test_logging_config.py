@@ -0,0 +1,176 @@
+"""
+Test structured logging helpers.
+"""
+import logging
+import sys
+import pytest
+from app.telemetry.logging_config import get_logger, log_with_timing
+
+
+@pytest.fixture
+def logger():
+    """Create an isolated logger for testing."""
+    return logging.getLogger("tests.logging_config")
+
+
+class TestLogWithTiming:
+    """Test timed log records."""
+    
+    def test_fields_are_attached(self, logger, caplog):
+        """Test duration and extra fields end up on the record."""
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            log_with_timing(logger, "Done", duration_ms=12, confidence=0.9)
+        
+        assert caplog.records[0].extra_fields == {"confidence": 0.9, "duration_ms": 12}
+    
+    def test_suppressed_level_logs_nothing(self, logger, caplog):
+        """Test nothing is built or emitted when INFO is disabled (edge case)."""
+        with caplog.at_level(logging.WARNING, logger=logger.name):
+            log_with_timing(logger, "Done", duration_ms=12)
+        
+        assert caplog.records == []
+
+
+class TestGetLogger:
+    """Test logger lookup."""
+    
+    def test_cached_logger_is_the_stdlib_singleton(self):
+        """Test the cached lookup returns the same logger as logging.getLogger."""
+        assert get_logger("tests.cached") is get_logger("tests.cached")
+        assert get_logger("tests.cached") is logging.getLogger("tests.cached")
+
+
+class TestStructuredFormatter:
+    """Test JSON log formatting."""
+    
+    def test_record_is_formatted_as_json(self, logger):
+        """Test records serialize to JSON with the standard fields."""
+        import json
+        from app.telemetry.logging_config import StructuredFormatter
+        
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 1, "Hello %s", ("world",), None)
+        record.extra_fields = {"duration_ms": 5}
+        data = json.loads(StructuredFormatter().format(record))
+        
+        assert data["message"] == "Hello world"
+        assert data["level"] == "INFO"
+        assert data["duration_ms"] == 5
+    
+    def test_timestamp_matches_datetime_isoformat(self):
+        """Test the cached timestamp formatting agrees with datetime."""
+        from datetime import datetime, timezone
+        from app.telemetry.logging_config import format_timestamp
+        
+        for created in (1700000000.5, 1700000000.000001, 1700000001.999999):
+            expected = datetime.fromtimestamp(created, timezone.utc).replace(tzinfo=None).isoformat(timespec="microseconds")
+            assert format_timestamp(created) == expected + "Z"
+
+
+class TestQueuedLogging:
+    """Test records handed over to the logging thread."""
+    
+    def test_prepared_record_keeps_request_context(self, logger):
+        """Test request ID, message and traceback survive the hand-off."""
+        import json
+        import queue
+        from app.telemetry.logging_config import (
+            RequestContextQueueHandler, StructuredFormatter, request_id_ctx
+        )
+        
+        log_queue = queue.SimpleQueue()
+        handler = RequestContextQueueHandler(log_queue)
+        token = request_id_ctx.set("req_test")
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                handler.handle(logger.makeRecord(
+                    logger.name, logging.ERROR, __file__, 1, "Failed %s", ("job",), sys.exc_info()
+                ))
+        finally:
+            request_id_ctx.reset(token)
+        
+        data = json.loads(StructuredFormatter().format(log_queue.get_nowait()))
+        assert data["request_id"] == "req_test"
+        assert data["message"] == "Failed job"
+        assert "ValueError: boom" in data["exception"]
+
+
+class TestSamplingFilter:
+    """Test sampling of low-level records."""
+    
+    def make_record(self, logger, level):
+        return logger.makeRecord(logger.name, level, __file__, 1, "Sampled", (), None)
+    
+    def test_warnings_always_kept(self, logger):
+        """Test WARNING and above pass even with a zero rate (edge case)."""
+        from app.telemetry.logging_config import SamplingFilter
+        
+        sampler = SamplingFilter({logging.WARNING: 0.0, logging.ERROR: 0.0})
+        assert sampler.filter(self.make_record(logger, logging.WARNING))
+        assert sampler.filter(self.make_record(logger, logging.ERROR))
+    
+    def test_zero_rate_drops_records(self, logger):
+        """Test a zero rate drops every record at that level."""
+        from app.telemetry.logging_config import SamplingFilter
+        
+        sampler = SamplingFilter({logging.INFO: 0.0})
+        assert not any(sampler.filter(self.make_record(logger, logging.INFO)) for _ in range(100))
+        assert sampler.filter(self.make_record(logger, logging.DEBUG))
+    
+    def test_full_rate_keeps_records(self, logger):
+        """Test a rate of one keeps every record."""
+        from app.telemetry.logging_config import SamplingFilter
+        
+        sampler = SamplingFilter({logging.INFO: 1.0})
+        assert all(sampler.filter(self.make_record(logger, logging.INFO)) for _ in range(100))
+
+
+class TestFastJsonHandler:
+    """Test newline-delimited JSON output."""
+    
+    def test_writes_one_json_line_per_record(self, logger):
+        """Test each record is written as UTF-8 JSON ending in a newline."""
+        import io
+        import json
+        from app.telemetry.logging_config import FastJsonHandler
+        
+        stream = io.BytesIO()
+        handler = FastJsonHandler(stream)
+        handler.handle(logger.makeRecord(logger.name, logging.INFO, __file__, 1, "Café %s", ("ok",), None))
+        handler.handle(logger.makeRecord(logger.name, logging.WARNING, __file__, 1, "Second", (), None))
+        
+        lines = stream.getvalue().split(b"\n")
+        assert lines[-1] == b""
+        assert json.loads(lines[0])["message"] == "Café ok"
+        assert json.loads(lines[1])["level"] == "WARNING"
+
+
+class TestSetupLogging:
+    """Test (re)configuring application logging."""
+    
+    def test_setup_twice_replaces_handler_and_listener(self):
+        """Test a second setup leaves one queue handler and stops the old listener (edge case)."""
+        from app.telemetry import logging_config
+        
+        logging_config.setup_logging()
+        first_listener = logging_config._queue_listener
+        logging_config.setup_logging()
+        
+        handlers = [
+            h for h in logging.getLogger().handlers
+            if isinstance(h, logging_config.RequestContextQueueHandler)
+        ]
+        assert handlers == [logging_config._queue_handler]
+        assert first_listener._thread is None
+        assert logging_config._queue_listener is not first_listener
+    
+    def test_stopping_listener_is_idempotent(self):
+        """Test the exit hook can run after an explicit stop (negative case)."""
+        from app.telemetry import logging_config
+        
+        logging_config._stop_queue_listener()
+        logging_config._stop_queue_listener()
+        
+        logging_config.setup_logging()
+        assert logging_config._queue_listener._thread is not None
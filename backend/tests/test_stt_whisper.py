@@ -0,0 +1,122 @@
+"""
+Test Faster Whisper provider helpers.
+"""
+import io
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from app.providers import stt_whisper
+from app.providers.stt_whisper import decode_audio, resolve_compute_type
+from app.providers.tts_piper import wav_header
+
+
+def make_wav(sample_rate: int, num_samples: int = 1600) -> bytes:
+    """Build a silent 16-bit mono WAV file."""
+    data_size = num_samples * 2
+    return wav_header(sample_rate, data_size) + bytes(data_size)
+
+
+class TestDecodeAudio:
+    """Test in-memory audio decoding."""
+    
+    def test_arrays_pass_through(self):
+        """Test decoded samples are returned unchanged."""
+        samples = np.zeros(16000, dtype=np.float32)
+        assert decode_audio(samples) is samples
+    
+    def test_16khz_wav_is_decoded(self):
+        """Test 16 kHz WAV bytes are decoded to float32 samples."""
+        if stt_whisper.sf is None:
+            pytest.skip("soundfile not installed")
+        samples = decode_audio(make_wav(16000))
+        assert isinstance(samples, np.ndarray)
+        assert samples.dtype == np.float32
+        assert samples.shape == (1600,)
+    
+    def test_other_rates_fall_back_to_file(self):
+        """Test audio needing resampling is left for faster-whisper (edge case)."""
+        decoded = decode_audio(make_wav(22050))
+        assert isinstance(decoded, io.BytesIO)
+        assert decoded.tell() == 0
+    
+    def test_undecodable_input_falls_back_to_file(self):
+        """Test formats libsndfile can't read are left for faster-whisper (negative case)."""
+        decoded = decode_audio(b"not audio at all")
+        assert isinstance(decoded, io.BytesIO)
+        assert decoded.tell() == 0
+
+
+class TestComputeType:
+    """Test compute type selection."""
+    
+    def test_auto_compute_type_follows_device(self):
+        """Test auto picks int8 on CPU and int8_float16 on CUDA."""
+        assert resolve_compute_type("cpu") == "int8"
+        assert resolve_compute_type("cuda") == "int8_float16"
+        assert resolve_compute_type("cuda:1") == "int8_float16"
+    
+    def test_explicit_compute_type_is_kept(self):
+        """Test explicit compute types are not overridden."""
+        assert resolve_compute_type("cuda", "float16") == "float16"
+
+
+class FakeModel:
+    """Whisper model returning one segment per word of the audio bytes."""
+    
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+    
+    def transcribe(self, audio, **kwargs):
+        def segments():
+            for i, word in enumerate(audio.read().decode().split()):
+                if i == self.fail_after:
+                    raise RuntimeError("decoder error")
+                yield SimpleNamespace(text=f" {word} ")
+        return segments(), SimpleNamespace(language="en")
+
+
+@pytest.fixture
+def make_provider(monkeypatch):
+    """Create a Faster Whisper provider backed by a fake model."""
+    def factory(**model_kwargs):
+        monkeypatch.setattr(stt_whisper, "WhisperModel", object)
+        monkeypatch.setattr(stt_whisper, "sf", None)
+        monkeypatch.setattr(stt_whisper, "_load_model", lambda *args: FakeModel(**model_kwargs))
+        return stt_whisper.FasterWhisperProvider()
+    return factory
+
+
+class TestTranscribeBatch:
+    """Test parallel batch transcription."""
+    
+    @pytest.mark.asyncio
+    async def test_failing_file_does_not_fail_the_batch(self, make_provider):
+        """Test a failing file yields its own exception, the others their results (negative case)."""
+        from app.providers.base import ProviderException
+        provider = make_provider(fail_after=1)
+        
+        results = await provider.transcribe_batch([io.BytesIO(b"hello"), io.BytesIO(b"two words")])
+        
+        assert results[0].text == "hello"
+        assert isinstance(results[1], ProviderException)
+
+
+class TestCpuThreads:
+    """Test CTranslate2 thread sizing."""
+    
+    def test_auto_threads_split_cores_across_workers(self, monkeypatch):
+        """Test auto threads divide the cores between processes and model workers."""
+        from app.core.config import Settings
+        from app.providers.registry import whisper_cpu_threads
+        monkeypatch.setattr("os.cpu_count", lambda: 16)
+        
+        assert whisper_cpu_threads(Settings(workers=1)) == 16
+        assert whisper_cpu_threads(Settings(workers=4, whisper_num_workers=2)) == 2
+        assert whisper_cpu_threads(Settings(workers=32)) == 1
+        assert whisper_cpu_threads(Settings(workers=4, gpu_mode=True)) == 16
+    
+    def test_explicit_threads_are_kept(self):
+        """Test a configured thread count is not overridden."""
+        from app.core.config import Settings
+        from app.providers.registry import whisper_cpu_threads
+        assert whisper_cpu_threads(Settings(workers=4, whisper_cpu_threads=3)) == 3
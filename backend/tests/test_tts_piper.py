@@ -0,0 +1,140 @@
+"""
+Test Piper TTS provider.
+"""
+import struct
+import pytest
+from types import SimpleNamespace
+from app.providers import tts_piper
+from app.providers.tts_piper import PiperTTSProvider
+
+
+class FakeVoice:
+    """In-process Piper voice producing one PCM chunk per sentence."""
+    
+    loads = 0
+    calls = 0
+    
+    def __init__(self):
+        self.config = SimpleNamespace(sample_rate=22050)
+    
+    @classmethod
+    def load(cls, model_file):
+        cls.loads += 1
+        return cls()
+    
+    def synthesize_stream_raw(self, text):
+        FakeVoice.calls += 1
+        for sentence in text.split("."):
+            if sentence.strip():
+                yield b"\x01\x00" * len(sentence)
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    """Create a provider backed by the fake in-process voice."""
+    (tmp_path / "test-voice.onnx").write_bytes(b"")
+    FakeVoice.loads = 0
+    FakeVoice.calls = 0
+    monkeypatch.setattr(tts_piper, "PiperVoice", FakeVoice)
+    return PiperTTSProvider(model_path=str(tmp_path), voice="test-voice")
+
+
+class TestInProcessVoice:
+    """Test synthesis through a loaded voice."""
+    
+    @pytest.mark.asyncio
+    async def test_voice_is_loaded_once(self, provider):
+        """Test the voice model is loaded at init and reused by requests."""
+        assert provider.is_available
+        await provider.synthesize("Hello.")
+        await provider.synthesize("Hello again.")
+        assert FakeVoice.loads == 1
+    
+    @pytest.mark.asyncio
+    async def test_synthesize_returns_wav(self, provider):
+        """Test buffered synthesis returns a WAV with the correct sizes."""
+        audio = await provider.synthesize("Hello. World.")
+        pcm_size = 2 * (len("Hello") + len(" World"))
+        
+        assert audio[:4] == b"RIFF"
+        assert struct.unpack("<I", audio[40:44])[0] == pcm_size
+        assert len(audio) == 44 + pcm_size
+    
+    @pytest.mark.asyncio
+    async def test_stream_matches_buffered_audio(self, provider):
+        """Test streamed chunks carry the same PCM as buffered synthesis."""
+        chunks = [chunk async for chunk in provider.synthesize_stream("Hello. World.")]
+        buffered = await provider.synthesize("Hello. World.")
+        
+        assert len(chunks) == 2
+        assert b"".join(chunks)[44:] == buffered[44:]
+
+
+class TestSynthesisCache:
+    """Test caching of synthesized replies."""
+    
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_served_from_cache(self, provider):
+        """Test the same text and voice are synthesized only once."""
+        first = await provider.synthesize("Our office hours are 8 to 5.")
+        second = await provider.synthesize("Our office hours are 8 to 5.")
+        streamed = [chunk async for chunk in provider.synthesize_stream("Our office hours are 8 to 5.")]
+        
+        assert first == second == streamed[0]
+        assert FakeVoice.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, provider):
+        """Test the cache never grows past its size (edge case)."""
+        provider.cache_size = 2
+        for text in ("One.", "Two.", "One.", "Three."):
+            await provider.synthesize(text)
+        
+        assert [key[1] for key in provider._cache] == ["One.", "Three."]
+    
+    @pytest.mark.asyncio
+    async def test_streamed_text_is_cached(self, provider):
+        """Test a completed stream is cached as a full WAV for later requests."""
+        streamed = [chunk async for chunk in provider.synthesize_stream("Hello. World.")]
+        restreamed = [chunk async for chunk in provider.synthesize_stream("Hello. World.")]
+        buffered = await provider.synthesize("Hello. World.")
+        
+        assert FakeVoice.calls == 1
+        assert restreamed == [buffered]
+        assert buffered[44:] == b"".join(streamed)[44:]
+        assert struct.unpack("<I", buffered[40:44])[0] == len(buffered) - 44
+
+
+class TestFallbackAudio:
+    """Test the silent fallback WAV."""
+    
+    def test_fallback_is_built_once(self, tmp_path):
+        """Test every fallback call returns the same precomputed WAV."""
+        provider = PiperTTSProvider(piper_executable="missing-piper", model_path=str(tmp_path))
+        first = provider._generate_fallback_audio("a")
+        assert provider._generate_fallback_audio("b") is first
+        assert first[:4] == b"RIFF"
+        assert len(first) == 44 + 16000 * 2 * 2
+        assert struct.unpack('<4sI4s4sIHHIIHH4sI', first[:44]) == (
+            b'RIFF', 36 + 64000, b'WAVE', b'fmt ', 16, 1, 1,
+            16000, 32000, 2, 16, b'data', 64000
+        )
+
+
+class TestHealthCheck:
+    """Test the cached CLI health probe."""
+    
+    @pytest.mark.asyncio
+    async def test_probe_result_is_reused_within_ttl(self, tmp_path, monkeypatch):
+        """Test piper is only probed once per TTL window."""
+        provider = PiperTTSProvider(piper_executable="missing-piper", model_path=str(tmp_path))
+        probes = []
+        
+        def fake_run(*args, **kwargs):
+            probes.append(args)
+            return SimpleNamespace(returncode=0)
+        
+        monkeypatch.setattr(tts_piper.subprocess, "run", fake_run)
+        assert await provider.health_check() is True
+        assert await provider.health_check() is True
+        assert len(probes) == 1